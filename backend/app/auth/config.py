@@ -12,6 +12,13 @@ from pydantic_settings import BaseSettings
 logger = logging.getLogger("app.auth.config")
 
 
+# Password policy character classes, compiled once instead of on every check
+UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+LOWERCASE_PATTERN = re.compile(r"[a-z]")
+DIGIT_PATTERN = re.compile(r"\d")
+SPECIAL_CHARACTER_PATTERN = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
+
+
 class AuthSettings(BaseSettings):
     """Authentication-related settings."""
 
@@ -86,16 +93,16 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < auth_settings.password_min_length:
         return False, f"Password must be at least {auth_settings.password_min_length} characters"
 
-    if auth_settings.password_require_uppercase and not re.search(r"[A-Z]", password):
+    if auth_settings.password_require_uppercase and not UPPERCASE_PATTERN.search(password):
         return False, "Password must contain at least one uppercase letter"
 
-    if auth_settings.password_require_lowercase and not re.search(r"[a-z]", password):
+    if auth_settings.password_require_lowercase and not LOWERCASE_PATTERN.search(password):
         return False, "Password must contain at least one lowercase letter"
 
-    if auth_settings.password_require_digit and not re.search(r"\d", password):
+    if auth_settings.password_require_digit and not DIGIT_PATTERN.search(password):
         return False, "Password must contain at least one digit"
 
-    if auth_settings.password_require_special and not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+    if auth_settings.password_require_special and not SPECIAL_CHARACTER_PATTERN.search(password):
         return False, "Password must contain at least one special character (!@#$%^&*(),.?\":{}|<>)"
 
     return True, ""
@@ -3,6 +3,7 @@ from app.config.gateways import (
     get_all_upload_gateways,
     get_charge_keywords,
     get_gateway_display_name,
+    get_gateway_display_names,
     is_valid_upload_gateway,
     get_external_gateways,
     get_internal_gateways,
@@ -17,6 +18,7 @@ __all__ = [
     "get_all_upload_gateways",
     "get_charge_keywords",
     "get_gateway_display_name",
+    "get_gateway_display_names",
     "is_valid_upload_gateway",
     "get_external_gateways",
     "get_internal_gateways",
@@ -103,6 +103,40 @@ def get_gateway_display_name(gateway: str, db_session: Optional[Session] = None)
     return gateway.capitalize()
 
 
+def get_gateway_display_names(gateways: List[str], db_session: Optional[Session] = None) -> Dict[str, str]:
+    """
+    Get display names for several gateways in a single query.
+
+    Args:
+        gateways: File config names (e.g., ['equity', 'kcb'])
+        db_session: Database session
+
+    Returns:
+        Dict of gateway -> display name, falling back to the capitalized gateway name
+    """
+    display_names = {gateway: gateway.capitalize() for gateway in gateways}
+    if not db_session or not gateways:
+        return display_names
+
+    try:
+        from app.sqlModels.gatewayEntities import GatewayFileConfig, Gateway
+
+        stmt = (
+            select(GatewayFileConfig.name, Gateway.display_name)
+            .join(GatewayFileConfig, GatewayFileConfig.gateway_id == Gateway.id)
+            .where(GatewayFileConfig.name.in_([gateway.lower() for gateway in gateways]))
+        )
+        found = {name: display_name for name, display_name in db_session.execute(stmt).all()}
+        for gateway in gateways:
+            if found.get(gateway.lower()):
+                display_names[gateway] = found[gateway.lower()]
+
+    except Exception as e:
+        logger.warning(f"Error fetching display names for {gateways}: {e}")
+
+    return display_names
+
+
 def is_valid_upload_gateway(gateway: str, db_session: Optional[Session] = None) -> bool:
     """Check if gateway is valid for file uploads."""
     return gateway.lower() in get_all_upload_gateways(db_session)
@@ -208,29 +242,27 @@ def get_gateways_info(db_session: Optional[Session] = None) -> Dict[str, Any]:
 
     from app.sqlModels.gatewayEntities import GatewayFileConfig, Gateway, FileConfigType
 
-    # Get external configs
-    ext_stmt = (
-        select(GatewayFileConfig.name)
-        .join(Gateway, GatewayFileConfig.gateway_id == Gateway.id)
-        .where(
-            GatewayFileConfig.config_type == FileConfigType.EXTERNAL.value,
-            GatewayFileConfig.is_active == True,
-            Gateway.is_active == True,
-        )
-    )
-    external = list(db_session.execute(ext_stmt).scalars().all())
-
-    # Get internal configs
-    int_stmt = (
-        select(GatewayFileConfig.name)
+    # One query for both config types and their charge keywords
+    stmt = (
+        select(GatewayFileConfig.name, GatewayFileConfig.config_type, GatewayFileConfig.charge_keywords)
         .join(Gateway, GatewayFileConfig.gateway_id == Gateway.id)
         .where(
-            GatewayFileConfig.config_type == FileConfigType.INTERNAL.value,
+            GatewayFileConfig.config_type.in_(
+                [FileConfigType.EXTERNAL.value, FileConfigType.INTERNAL.value]
+            ),
             GatewayFileConfig.is_active == True,
             Gateway.is_active == True,
         )
     )
-    internal = list(db_session.execute(int_stmt).scalars().all())
+    external = []
+    internal = []
+    charge_keywords = {}
+    for name, config_type, keywords in db_session.execute(stmt).all():
+        if config_type == FileConfigType.EXTERNAL.value:
+            external.append(name)
+            charge_keywords[name] = keywords or []
+        else:
+            internal.append(name)
 
     return {
         "external_gateways": external,
@@ -239,7 +271,5 @@ def get_gateways_info(db_session: Optional[Session] = None) -> Dict[str, Any]:
             "external": external,
             "internal": internal,
         },
-        "charge_keywords": {
-            gw: get_charge_keywords(gw, db_session) for gw in external
-        },
+        "charge_keywords": charge_keywords,
     }
@@ -19,7 +19,7 @@ from app.sqlModels.transactionEntities import (
 )
 from app.auth.dependencies import require_active_user
 from app.sqlModels.authEntities import User
-from app.config.gateways import get_gateway_display_name
+from app.config.gateways import get_gateway_display_names
 
 router = APIRouter(prefix='/api/v1/dashboard', tags=['Dashboard'])
 
@@ -63,6 +63,32 @@ async def get_dashboard_stats(
     # ======================================================================
     # 2. Per-gateway tiles
     # ======================================================================
+    # One grouped query for external debits (DEBIT) and internal payouts (PAYOUT)
+    # of every gateway, instead of two aggregate queries per gateway
+    tile_gateways = [f"{base_gw}_{side}" for base_gw in base_gateways for side in ("external", "internal")]
+    tile_rows = db.query(
+        Transaction.gateway,
+        Transaction.transaction_type,
+        func.count(Transaction.id).label('count'),
+        func.sum(case(
+            (Transaction.reconciliation_status == ReconciliationStatus.UNRECONCILED.value, 1),
+            else_=0
+        )).label('unreconciled'),
+        func.sum(case(
+            (Transaction.reconciliation_status == ReconciliationStatus.RECONCILED.value, 1),
+            else_=0
+        )).label('reconciled'),
+    ).filter(
+        Transaction.gateway.in_(tile_gateways),
+        Transaction.transaction_type.in_([TransactionType.DEBIT.value, TransactionType.PAYOUT.value]),
+    ).group_by(
+        Transaction.gateway,
+        Transaction.transaction_type,
+    ).all()
+    # Keyed lower-cased: MySQL groups gateway names case-insensitively
+    tile_stats = {(row.gateway.lower(), row.transaction_type): row for row in tile_rows}
+    display_names = get_gateway_display_names(base_gateways, db)
+
     gateway_tiles = []
     total_reconciled_all = 0
     total_transactions_all = 0
@@ -71,45 +97,16 @@ async def get_dashboard_stats(
         external_gw = f"{base_gw}_external"
         internal_gw = f"{base_gw}_internal"
 
-        # External debits (DEBIT type only)
-        ext_stats = db.query(
-            func.count(Transaction.id).label('count'),
-            func.sum(case(
-                (Transaction.reconciliation_status == ReconciliationStatus.UNRECONCILED.value, 1),
-                else_=0
-            )).label('unreconciled'),
-            func.sum(case(
-                (Transaction.reconciliation_status == ReconciliationStatus.RECONCILED.value, 1),
-                else_=0
-            )).label('reconciled'),
-        ).filter(
-            Transaction.gateway == external_gw,
-            Transaction.transaction_type == TransactionType.DEBIT.value,
-        ).first()
-
-        # Internal payouts (PAYOUT type)
-        int_stats = db.query(
-            func.count(Transaction.id).label('count'),
-            func.sum(case(
-                (Transaction.reconciliation_status == ReconciliationStatus.UNRECONCILED.value, 1),
-                else_=0
-            )).label('unreconciled'),
-            func.sum(case(
-                (Transaction.reconciliation_status == ReconciliationStatus.RECONCILED.value, 1),
-                else_=0
-            )).label('reconciled'),
-        ).filter(
-            Transaction.gateway == internal_gw,
-            Transaction.transaction_type == TransactionType.PAYOUT.value,
-        ).first()
-
-        ext_count = int(ext_stats.count or 0)
-        ext_unreconciled = int(ext_stats.unreconciled or 0)
-        ext_reconciled = int(ext_stats.reconciled or 0)
-
-        int_count = int(int_stats.count or 0)
-        int_unreconciled = int(int_stats.unreconciled or 0)
-        int_reconciled = int(int_stats.reconciled or 0)
+        ext_stats = tile_stats.get((external_gw.lower(), TransactionType.DEBIT.value))
+        int_stats = tile_stats.get((internal_gw.lower(), TransactionType.PAYOUT.value))
+
+        ext_count = int(ext_stats.count or 0) if ext_stats else 0
+        ext_unreconciled = int(ext_stats.unreconciled or 0) if ext_stats else 0
+        ext_reconciled = int(ext_stats.reconciled or 0) if ext_stats else 0
+
+        int_count = int(int_stats.count or 0) if int_stats else 0
+        int_unreconciled = int(int_stats.unreconciled or 0) if int_stats else 0
+        int_reconciled = int(int_stats.reconciled or 0) if int_stats else 0
 
         unreconciled_total = ext_unreconciled + int_unreconciled
         reconciled_total = ext_reconciled + int_reconciled
@@ -120,7 +117,7 @@ async def get_dashboard_stats(
 
         gateway_tiles.append({
             "base_gateway": base_gw,
-            "display_name": get_gateway_display_name(base_gw, db),
+            "display_name": display_names[base_gw],
             "external_debit_count": ext_count,
             "internal_payout_count": int_count,
             "unreconciled_count": unreconciled_total,
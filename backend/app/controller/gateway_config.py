@@ -8,7 +8,7 @@ maker-checker approval workflow:
 - Super admins have no access to gateway management
 """
 import math
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -90,29 +90,48 @@ def _build_change_request_response(
     db: Session,
 ) -> GatewayChangeRequestResponse:
     """Build a GatewayChangeRequestResponse from a change request."""
-    stmt = select(User).where(User.id == req.requested_by_id)
-    requested_by = db.execute(stmt).scalar_one_or_none()
-
-    reviewed_by = None
-    if req.reviewed_by_id:
-        stmt = select(User).where(User.id == req.reviewed_by_id)
-        reviewed_by = db.execute(stmt).scalar_one_or_none()
-
-    return GatewayChangeRequestResponse(
-        id=req.id,
-        request_type=req.request_type,
-        status=req.status,
-        unified_gateway_id=req.unified_gateway_id,
-        gateway_display_name=req.gateway_display_name,
-        proposed_changes=req.proposed_changes,
-        requested_by_id=req.requested_by_id,
-        requested_by_name=f"{requested_by.first_name} {requested_by.last_name}" if requested_by else None,
-        created_at=req.created_at,
-        reviewed_by_id=req.reviewed_by_id,
-        reviewed_by_name=f"{reviewed_by.first_name} {reviewed_by.last_name}" if reviewed_by else None,
-        reviewed_at=req.reviewed_at,
-        rejection_reason=req.rejection_reason,
-    )
+    return _build_change_request_responses([req], db)[0]
+
+
+def _build_change_request_responses(
+    requests: List[GatewayChangeRequest],
+    db: Session,
+) -> List[GatewayChangeRequestResponse]:
+    """
+    Build GatewayChangeRequestResponses for a list of change requests.
+
+    Requesters and reviewers of every request are loaded in one query, instead
+    of one or two user lookups per request.
+    """
+    user_ids = {req.requested_by_id for req in requests}
+    user_ids.update(req.reviewed_by_id for req in requests if req.reviewed_by_id)
+    users = {}
+    if user_ids:
+        stmt = select(User).where(User.id.in_(user_ids))
+        users = {user.id: user for user in db.execute(stmt).scalars().all()}
+
+    def _full_name(user_id: Optional[int]) -> Optional[str]:
+        user = users.get(user_id) if user_id else None
+        return f"{user.first_name} {user.last_name}" if user else None
+
+    return [
+        GatewayChangeRequestResponse(
+            id=req.id,
+            request_type=req.request_type,
+            status=req.status,
+            unified_gateway_id=req.unified_gateway_id,
+            gateway_display_name=req.gateway_display_name,
+            proposed_changes=req.proposed_changes,
+            requested_by_id=req.requested_by_id,
+            requested_by_name=_full_name(req.requested_by_id),
+            created_at=req.created_at,
+            reviewed_by_id=req.reviewed_by_id,
+            reviewed_by_name=_full_name(req.reviewed_by_id),
+            reviewed_at=req.reviewed_at,
+            rejection_reason=req.rejection_reason,
+        )
+        for req in requests
+    ]
 
 
 def _check_super_admin(current_user: User):
@@ -337,7 +356,7 @@ async def get_my_change_requests(
     stmt = select(GatewayChangeRequest).where(*conditions).order_by(GatewayChangeRequest.created_at.desc())
     requests = db.execute(stmt).scalars().all()
 
-    response_requests = [_build_change_request_response(req, db) for req in requests]
+    response_requests = _build_change_request_responses(requests, db)
 
     return GatewayChangeRequestListResponse(
         count=len(response_requests),
@@ -371,7 +390,7 @@ async def get_pending_change_requests(
     ).offset((page - 1) * page_size).limit(page_size)
 
     requests = db.execute(stmt).scalars().all()
-    response_requests = [_build_change_request_response(req, db) for req in requests]
+    response_requests = _build_change_request_responses(requests, db)
 
     return GatewayChangeRequestListResponse(
         count=total_count,
@@ -412,7 +431,7 @@ async def get_all_change_requests(
     ).offset((page - 1) * page_size).limit(page_size)
 
     requests = db.execute(stmt).scalars().all()
-    response_requests = [_build_change_request_response(req, db) for req in requests]
+    response_requests = _build_change_request_responses(requests, db)
 
     return GatewayChangeRequestListResponse(
         count=total_count,
@@ -346,43 +346,47 @@ async def manual_reconcile_bulk(
             detail=f"Invalid transaction type. Must be one of: {', '.join(valid_types)}"
         )
 
-    # Get eligible transactions (unreconciled and not already pending)
-    transactions = db.query(Transaction).filter(
-        Transaction.id.in_(transaction_ids),
-        Transaction.reconciliation_status == ReconciliationStatus.UNRECONCILED.value,
-        or_(
-            Transaction.authorization_status.is_(None),
-            Transaction.authorization_status == AuthorizationStatus.REJECTED.value
-        )
-    ).all()
+    # Get eligible transaction IDs (unreconciled and not already pending)
+    eligible_ids = [
+        row.id for row in db.query(Transaction.id).filter(
+            Transaction.id.in_(transaction_ids),
+            Transaction.reconciliation_status == ReconciliationStatus.UNRECONCILED.value,
+            or_(
+                Transaction.authorization_status.is_(None),
+                Transaction.authorization_status == AuthorizationStatus.REJECTED.value
+            )
+        ).all()
+    ]
 
-    if not transactions:
+    if not eligible_ids:
         raise HTTPException(
             status_code=404,
             detail="No eligible transactions found. Transactions must be unreconciled and not already pending authorization."
         )
 
-    # Update all transactions
+    # Every row gets the same values, so update them with one statement
+    # instead of loading ORM objects and flushing one UPDATE per row
     now = datetime.now(ZoneInfo("Africa/Nairobi"))
-    for txn in transactions:
-        txn.transaction_type = request_body.transaction_type
-        txn.is_manually_reconciled = "true"
-        txn.manual_recon_note = note.strip()
-        txn.manual_recon_by = current_user.id
-        txn.manual_recon_at = now
-        txn.authorization_status = AuthorizationStatus.PENDING.value
+    db.query(Transaction).filter(Transaction.id.in_(eligible_ids)).update({
+        Transaction.transaction_type: request_body.transaction_type,
+        Transaction.is_manually_reconciled: "true",
+        Transaction.manual_recon_note: note.strip(),
+        Transaction.manual_recon_by: current_user.id,
+        Transaction.manual_recon_at: now,
+        Transaction.authorization_status: AuthorizationStatus.PENDING.value,
+    }, synchronize_session=False)
 
     # Create audit log
     audit_log = AuditLog(
         user_id=current_user.id,
         action="bulk_manual_reconcile",
         resource_type="transaction",
-        resource_id=f"bulk:{len(transactions)}",
+        resource_id=f"bulk:{len(eligible_ids)}",
         details={
             "transaction_type": request_body.transaction_type,
             "note": note.strip(),
-            "count": len(transactions),
-            "transaction_ids": [t.id for t in transactions],
+            "count": len(eligible_ids),
+            "transaction_ids": eligible_ids,
         },
         ip_address=request.client.host if request.client else None,
         user_agent=request.headers.get("user-agent"),
@@ -393,9 +397,9 @@ async def manual_reconcile_bulk(
     db.commit()
 
     return JSONResponse(content={
-        "message": f"Successfully submitted {len(transactions)} transactions for authorization",
-        "count": len(transactions),
-        "transaction_ids": [t.id for t in transactions],
+        "message": f"Successfully submitted {len(eligible_ids)} transactions for authorization",
+        "count": len(eligible_ids),
+        "transaction_ids": eligible_ids,
     })
 
 
@@ -519,43 +523,52 @@ async def authorize_bulk(
             detail="Action must be 'authorize' or 'reject'"
         )
 
-    # Get pending transactions
-    transactions = db.query(Transaction).filter(
-        Transaction.id.in_(transaction_ids),
-        Transaction.authorization_status == AuthorizationStatus.PENDING.value
-    ).all()
+    # Get pending transaction IDs
+    pending_ids = [
+        row.id for row in db.query(Transaction.id).filter(
+            Transaction.id.in_(transaction_ids),
+            Transaction.authorization_status == AuthorizationStatus.PENDING.value
+        ).all()
+    ]
 
-    if not transactions:
+    if not pending_ids:
         raise HTTPException(
             status_code=404,
             detail="No pending transactions found with the given IDs"
         )
 
-    # Update all transactions
+    # Every row gets the same values, so update them with one statement
     now = datetime.now(ZoneInfo("Africa/Nairobi"))
-    for txn in transactions:
-        if action == 'authorize':
-            txn.authorization_status = AuthorizationStatus.AUTHORIZED.value
-            txn.reconciliation_status = ReconciliationStatus.RECONCILED.value
-        else:
-            txn.authorization_status = AuthorizationStatus.REJECTED.value
-            txn.is_manually_reconciled = None
-
-        txn.authorized_by = current_user.id
-        txn.authorized_at = now
-        txn.authorization_note = note
+    if action == 'authorize':
+        values = {
+            Transaction.authorization_status: AuthorizationStatus.AUTHORIZED.value,
+            Transaction.reconciliation_status: ReconciliationStatus.RECONCILED.value,
+        }
+    else:
+        values = {
+            Transaction.authorization_status: AuthorizationStatus.REJECTED.value,
+            Transaction.is_manually_reconciled: None,
+        }
+    values.update({
+        Transaction.authorized_by: current_user.id,
+        Transaction.authorized_at: now,
+        Transaction.authorization_note: note,
+    })
+    db.query(Transaction).filter(Transaction.id.in_(pending_ids)).update(
+        values, synchronize_session=False
+    )
 
     # Create audit log
     audit_log = AuditLog(
         user_id=current_user.id,
         action=f"bulk_authorization_{action}",
         resource_type="transaction",
-        resource_id=f"bulk:{len(transactions)}",
+        resource_id=f"bulk:{len(pending_ids)}",
         details={
             "action": action,
             "note": note,
-            "count": len(transactions),
-            "transaction_ids": [t.id for t in transactions],
+            "count": len(pending_ids),
+            "transaction_ids": pending_ids,
         },
         ip_address=request.client.host if request.client else None,
         user_agent=request.headers.get("user-agent"),
@@ -566,8 +579,8 @@ async def authorize_bulk(
     db.commit()
 
     return JSONResponse(content={
-        "message": f"Successfully {action}d {len(transactions)} transactions",
+        "message": f"Successfully {action}d {len(pending_ids)} transactions",
         "action": action,
-        "count": len(transactions),
-        "transaction_ids": [t.id for t in transactions],
+        "count": len(pending_ids),
+        "transaction_ids": pending_ids,
     })
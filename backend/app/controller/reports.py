@@ -21,7 +21,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import func
 from starlette.responses import JSONResponse
 
 from app.database.mysql_configs import get_database
@@ -53,16 +53,26 @@ async def get_available_gateways_for_reports(
     """
     external_gateways = get_external_gateways(db)
 
+    # Count transactions per stored gateway once, then attribute them to each
+    # external gateway in Python instead of running one COUNT per gateway.
+    # Names are compared lower-cased, as MySQL's collation compares them.
+    gateway_counts = {}
+    for stored_gw, n in (
+        db.query(Transaction.gateway, func.count(Transaction.id))
+        .group_by(Transaction.gateway)
+        .all()
+    ):
+        stored_gw = stored_gw.lower()
+        gateway_counts[stored_gw] = gateway_counts.get(stored_gw, 0) + n
+
     available = []
     for gw in external_gateways:
-        count = db.query(func.count(Transaction.id)).filter(
-            or_(
-                Transaction.gateway == gw,
-                Transaction.gateway == f"{gw}_external",
-                Transaction.gateway == f"{gw}_internal",
-                Transaction.gateway.endswith(f"_{gw}")
-            )
-        ).scalar()
+        gw_lower = gw.lower()
+        count = sum(
+            n for stored_gw, n in gateway_counts.items()
+            if stored_gw in (gw_lower, f"{gw_lower}_external", f"{gw_lower}_internal")
+            or stored_gw.endswith(f"_{gw_lower}")
+        )
 
         if count > 0:
             available.append({
@@ -160,9 +160,21 @@ def get_filter_options(
 
     Returns unique values for gateways, run IDs, statuses, and types.
     """
-    # Get unique gateways
-    gateways_query = select(Transaction.gateway).distinct()
-    gateways = [row[0] for row in db.execute(gateways_query).all() if row[0]]
+    # Get unique gateways, statuses and types in one round trip: the distinct
+    # combinations are few, so each column's values are collected from them
+    combinations_query = select(
+        Transaction.gateway,
+        Transaction.reconciliation_status,
+        Transaction.transaction_type,
+    ).distinct()
+    gateways, statuses, types = set(), set(), set()
+    for gateway, status, txn_type in db.execute(combinations_query).all():
+        if gateway:
+            gateways.add(gateway)
+        if status:
+            statuses.add(status)
+        if txn_type:
+            types.add(txn_type)
 
     # Get unique run IDs (limit to recent 50)
     run_ids_query = (
@@ -173,14 +185,6 @@ def get_filter_options(
     )
     run_ids = [row[0] for row in db.execute(run_ids_query).all() if row[0]]
 
-    # Get unique reconciliation statuses
-    statuses_query = select(Transaction.reconciliation_status).distinct()
-    statuses = [row[0] for row in db.execute(statuses_query).all() if row[0]]
-
-    # Get unique transaction types
-    types_query = select(Transaction.transaction_type).distinct()
-    types = [row[0] for row in db.execute(types_query).all() if row[0]]
-
     return {
         "gateways": sorted(gateways),
         "run_ids": run_ids,
@@ -6,9 +6,10 @@ Passwords are auto-generated and sent via welcome email.
 """
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -31,6 +32,9 @@ logger = logging.getLogger("app.users")
 
 router = APIRouter(prefix='/api/v1/users', tags=['User Management'])
 
+# Validates a whole list of User rows in one pydantic-core call
+USER_RESPONSE_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
 
 def log_audit(
     db: Session,
@@ -218,7 +222,7 @@ async def list_users(
 
     return UserListResponse(
         count=len(users),
-        users=[UserResponse.model_validate(u) for u in users]
+        users=USER_RESPONSE_LIST_ADAPTER.validate_python(users, from_attributes=True)
     )
 
 
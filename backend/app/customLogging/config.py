@@ -12,6 +12,7 @@ Provides production-ready logging configuration with:
 import logging
 import logging.config
 import os
+import re
 import sys
 from datetime import datetime
 from typing import Any, Dict
@@ -36,6 +37,14 @@ class SensitiveDataFilter(logging.Filter):
         "auth", "credential", "private_key", "secret_key"
     }
 
+    # Masking patterns compiled once per key instead of on every log record
+    SENSITIVE_PATTERNS = tuple(
+        (key, re.compile(
+            rf'({key}["\'\s:=]+)[^\s,}}\]"\']+(\s|,|}}|\]|"|\'|$)', re.IGNORECASE
+        ))
+        for key in SENSITIVE_KEYS
+    )
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter and mask sensitive data in log records."""
         if hasattr(record, "msg") and isinstance(record.msg, str):
@@ -43,19 +52,25 @@ class SensitiveDataFilter(logging.Filter):
             for key in self.SENSITIVE_KEYS:
                 if key in msg_lower:
                     # Mask the value - simple approach
-                    record.msg = self._mask_sensitive(record.msg)
+                    record.msg = self._mask_sensitive(record.msg, msg_lower)
                     break
         return True
 
-    def _mask_sensitive(self, msg: str) -> str:
-        """Mask sensitive values in message."""
+    def _mask_sensitive(self, msg: str, msg_lower: str) -> str:
+        """Mask sensitive values in message.
+
+        Args:
+            msg: Log message to mask.
+            msg_lower: The message lower-cased once by the caller.
+
+        Returns:
+            The message with values following sensitive keys masked.
+        """
         # This is a simple implementation - could be enhanced
-        for key in self.SENSITIVE_KEYS:
-            if key in msg.lower():
+        for key, pattern in self.SENSITIVE_PATTERNS:
+            if key in msg_lower:
                 # Replace potential values after common separators
-                import re
-                pattern = rf'({key}["\'\s:=]+)[^\s,}}\]"\']+(\s|,|}}|\]|"|\'|$)'
-                msg = re.sub(pattern, r'\1***MASKED***\2', msg, flags=re.IGNORECASE)
+                msg = pattern.sub(r'\1***MASKED***\2', msg)
         return msg
 
 
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Callable, Dict, Optional, List, BinaryIO
 
 from io import BytesIO
 
@@ -14,7 +14,6 @@ from app.storage.base import (
     XLS_ENGINE,
 )
 from app.storage.config import get_storage
-from app.storage.gcs_storage import GcsStorage
 
 
 def derive_external_gateway(gateway_name: str) -> str:
@@ -42,74 +41,106 @@ class DataLoader:
 
     Files are organized in gateway directories:
         {gateway}/{gateway_name}.{ext}
+
+    Gateway file lookups list each directory once per loader, so a loader sees
+    the files present at its first lookup (a reconciliation run uses one loader).
     """
 
     def __init__(self, storage: Optional[StorageBackend] = None):
         self.storage = storage or get_storage()
+        # Directory listings used by find_gateway_files, keyed by directory
+        self._directory_listings: Dict[str, List[str]] = {}
+        # Reader per supported extension
+        self._readers = {
+            XLSX_EXTENSION: self._read_xlsx_file,
+            XLS_EXTENSION: self._read_xls_file,
+            CSV_EXTENSION: self._read_csv_file,
+        }
+
+    @staticmethod
+    def _column_filter(columns: Optional[List[str]]) -> Optional[Callable[[Any], bool]]:
+        """
+        Build a reader usecols filter for the given columns.
+
+        Header names are matched case-insensitively with surrounding whitespace
+        ignored, like normalize_column_names, so the reader only materializes
+        the columns that will be used.
+
+        Args:
+            columns: Columns to keep, or None to keep every column.
 
-    def _read_excel_from_bytes(self, content: bytes, engine: str = XLSX_ENGINE) -> pd.DataFrame:
+        Returns:
+            Callable for the usecols argument of read_csv/read_excel, or None.
+        """
+        if not columns:
+            return None
+        wanted = {col.lower().strip() for col in columns}
+        return lambda name: str(name).lower().strip() in wanted
+
+    def _read_excel_from_bytes(
+        self,
+        content: bytes,
+        engine: str = XLSX_ENGINE,
+        usecols: Optional[Callable[[Any], bool]] = None,
+    ) -> pd.DataFrame:
         """Read Excel file from bytes (first sheet only, no rows skipped)."""
         try:
-            return pd.read_excel(BytesIO(content), sheet_name=0, engine=engine)
+            return pd.read_excel(BytesIO(content), sheet_name=0, engine=engine, usecols=usecols)
         except Exception as e:
             raise ReadFileException(f"Error reading Excel content: {str(e)}")
 
-    def _read_excel_from_path(self, file_path: str, engine: str = XLS_ENGINE) -> pd.DataFrame:
-        """Read Excel file from path (first sheet only, no rows skipped)."""
-        try:
-            return pd.read_excel(file_path, sheet_name=0, engine=engine)
-        except Exception as e:
-            raise ReadFileException(f"Error reading Excel file: {str(e)}")
-
-    def _read_csv_from_bytes(self, content: bytes) -> pd.DataFrame:
-        """Read CSV file from bytes (no rows skipped)."""
+    def _read_csv_from_handle(
+        self, handle: BinaryIO, usecols: Optional[Callable[[Any], bool]] = None
+    ) -> pd.DataFrame:
+        """Read CSV file from an open binary handle (no rows skipped)."""
         try:
-            return pd.read_csv(BytesIO(content))
+            return pd.read_csv(handle, usecols=usecols)
         except Exception as e:
             raise ReadFileException(f"Error reading CSV content: {str(e)}")
 
-    def _read_xlsx_file(self, gateway: str, filename: str) -> pd.DataFrame:
-        """Read XLSX file using openpyxl engine."""
+    def _read_xlsx_file(
+        self, gateway: str, filename: str, usecols: Optional[Callable[[Any], bool]] = None
+    ) -> pd.DataFrame:
+        """Read XLSX file using XLSX_ENGINE (calamine, or openpyxl without python-calamine)."""
         content = self.storage.read_file_bytes(gateway, filename)
-        return self._read_excel_from_bytes(content, XLSX_ENGINE)
+        return self._read_excel_from_bytes(content, XLSX_ENGINE, usecols)
 
-    def _read_xls_file(self, gateway: str, filename: str) -> pd.DataFrame:
-        """Read XLS file. Tries openpyxl first, falls back to xlrd."""
+    def _read_xls_file(
+        self, gateway: str, filename: str, usecols: Optional[Callable[[Any], bool]] = None
+    ) -> pd.DataFrame:
+        """Read XLS file. Tries XLSX_ENGINE first, falls back to xlrd on the same bytes."""
+        content = self.storage.read_file_bytes(gateway, filename)
         try:
-            content = self.storage.read_file_bytes(gateway, filename)
-            return self._read_excel_from_bytes(content, XLSX_ENGINE)
+            return self._read_excel_from_bytes(content, XLSX_ENGINE, usecols)
         except Exception:
             pass
 
-        if isinstance(self.storage, GcsStorage):
-            temp_path = None
-            try:
-                temp_path = self.storage.get_file_handle_for_xls(gateway, filename)
-                return self._read_excel_from_path(temp_path, XLS_ENGINE)
-            finally:
-                if temp_path:
-                    GcsStorage.cleanup_temp_file(temp_path)
-        else:
-            content = self.storage.read_file_bytes(gateway, filename)
-            return self._read_excel_from_bytes(content, XLS_ENGINE)
-
-    def _read_csv_file(self, gateway: str, filename: str) -> pd.DataFrame:
-        """Read CSV file."""
-        content = self.storage.read_file_bytes(gateway, filename)
-        return self._read_csv_from_bytes(content)
+        # xlrd reads from an in-memory buffer, so the download is not repeated
+        return self._read_excel_from_bytes(content, XLS_ENGINE, usecols)
+
+    def _read_csv_file(
+        self, gateway: str, filename: str, usecols: Optional[Callable[[Any], bool]] = None
+    ) -> pd.DataFrame:
+        """
+        Read CSV file.
+
+        Streams from the storage file handle: the parser pulls and tokenizes the
+        file in blocks, so the raw file is never held in memory alongside the
+        DataFrame being built.
+        """
+        with self.storage.get_file_handle(gateway, filename) as handle:
+            return self._read_csv_from_handle(handle, usecols)
 
-    def _read_file_by_extension(self, gateway: str, filename: str) -> pd.DataFrame:
-        """Read file based on its extension."""
+    def _read_file_by_extension(
+        self, gateway: str, filename: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Read file based on its extension, keeping only columns if given."""
         extension = self.storage.get_file_extension(filename)
 
-        if extension == XLSX_EXTENSION:
-            return self._read_xlsx_file(gateway, filename)
-        elif extension == XLS_EXTENSION:
-            return self._read_xls_file(gateway, filename)
-        elif extension == CSV_EXTENSION:
-            return self._read_csv_file(gateway, filename)
-        else:
+        reader = self._readers.get(extension)
+        if reader is None:
             raise ReadFileException(f"Unsupported file type: '{extension}'")
+        return reader(gateway, filename, self._column_filter(columns))
 
     def find_gateway_files(self, gateway_name: str) -> List[str]:
         """
@@ -125,7 +156,11 @@ class DataLoader:
             List of matching filenames.
         """
         external_gateway = derive_external_gateway(gateway_name)
-        gateway_files = self.storage.list_files(external_gateway)
+        # External and internal files share a directory, so it is listed only once
+        gateway_files = self._directory_listings.get(external_gateway)
+        if gateway_files is None:
+            gateway_files = self.storage.list_files(external_gateway)
+            self._directory_listings[external_gateway] = gateway_files
 
         # Match files that start with the gateway name
         gateway_lower = gateway_name.lower()
@@ -138,7 +173,9 @@ class DataLoader:
 
         return matching_files
 
-    def load_gateway_data(self, gateway_name: str) -> pd.DataFrame:
+    def load_gateway_data(
+        self, gateway_name: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Load data for a specific gateway.
 
@@ -146,6 +183,8 @@ class DataLoader:
 
         Args:
             gateway_name: Gateway name to load data for (e.g., 'equity', 'workpay_equity').
+            columns: Optional columns to read (matched case-insensitively);
+                     other columns in the file are skipped by the reader.
 
         Returns:
             DataFrame with file contents.
@@ -167,14 +206,17 @@ class DataLoader:
             extension = self.storage.get_file_extension(filename)
             raise ReadFileException(f"Unsupported file type: '{extension}'")
 
-        return self._read_file_by_extension(external_gateway, filename)
+        return self._read_file_by_extension(external_gateway, filename, columns)
 
-    def load_all_gateway_data(self, gateway_name: str) -> List[pd.DataFrame]:
+    def load_all_gateway_data(
+        self, gateway_name: str, columns: Optional[List[str]] = None
+    ) -> List[pd.DataFrame]:
         """
         Load data from all files for a specific gateway.
 
         Args:
             gateway_name: Gateway name to load data for.
+            columns: Optional columns to read (see load_gateway_data).
 
         Returns:
             List of DataFrames from all matching files.
@@ -193,7 +235,7 @@ class DataLoader:
         dataframes = []
         for filename in gateway_files:
             if self.storage.is_supported_extension(filename):
-                df = self._read_file_by_extension(external_gateway, filename)
+                df = self._read_file_by_extension(external_gateway, filename, columns)
                 dataframes.append(df)
 
         if not dataframes:
@@ -8,8 +8,10 @@ import re
 import logging
 from datetime import date
 from decimal import Decimal
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Optional, List, Dict, Callable, Hashable, Tuple
 
+import numpy as np
 import pandas as pd
 
 from app.dataLoading.data_loader import DataLoader
@@ -30,6 +32,217 @@ NARRATIVE_COLUMN = DETAILS_COLUMN
 
 logger = logging.getLogger("app.gateway_file")
 
+# Placeholder text (compared lower-cased) treated as an empty Reference/Details
+NULL_LIKE_VALUES = frozenset(("", "none", "null", "nan", "na"))
+
+# References treated as missing when building reconciliation keys
+MISSING_REFERENCE_VALUES = frozenset(("", "NA", "na", "N/A"))
+
+# Everything except digits, '.' and '-', stripped from amount text before parsing
+NON_AMOUNT_CHARACTERS_PATTERN = re.compile(r"[^\d\.-]")
+
+# Every string float() accepts (digits, sign, '.', '_', exponent, inf/nan) matches
+# this; anything else is a text reference and skips the float() attempt
+NUMERIC_CANDIDATE_PATTERN = re.compile(r"[\s\d._+\-eEiInNfFtTyYaA]+")
+
+
+def _map_distinct(series: pd.Series, func: Callable[[pd.Series], Any], fill: Any = None) -> pd.Series:
+    """
+    Apply a vectorized function to each distinct value of series, broadcast back by code.
+
+    Statement columns repeat heavily (dates, amounts, narratives), so the work
+    runs over the distinct values only and the results are taken back per row.
+
+    Args:
+        series: Values to map.
+        func: Called once with the distinct non-missing values as a Series;
+            returns array-like results aligned to them.
+        fill: Result for missing values.
+
+    Returns:
+        Series of results aligned to series.
+    """
+    codes, uniques = pd.factorize(series)
+    results = np.asarray(func(pd.Series(uniques)))
+    return pd.Series(
+        pd.api.extensions.take(results, codes, allow_fill=True, fill_value=fill),
+        index=series.index,
+    )
+
+
+@lru_cache(maxsize=128)
+def keyword_pattern(keywords: tuple) -> re.Pattern:
+    """
+    Compile a case-insensitive pattern matching any of the keywords literally.
+
+    Cached so repeated filters with the same keyword list reuse one compiled
+    pattern instead of rebuilding and recompiling the alternation every call.
+
+    The pattern only answers "does the value contain any keyword", so the
+    alternation is kept minimal: ASCII keywords are de-duplicated ignoring case
+    and a keyword containing another keyword is dropped, since the shorter one
+    already matches wherever the longer one would.
+
+    Args:
+        keywords: Tuple of keywords (hashable so it can be cached).
+
+    Returns:
+        Compiled regex pattern.
+    """
+    # Shortest first, so every keyword is checked against the shorter ones kept
+    minimal: List[str] = []
+    for keyword in sorted({k.lower() for k in keywords if k.isascii()}, key=len):
+        if not any(kept in keyword for kept in minimal):
+            minimal.append(keyword)
+    # Case folding can change the length of non-ASCII text; keep those verbatim
+    minimal.extend(k for k in dict.fromkeys(keywords) if not k.isascii())
+
+    return re.compile("|".join(map(re.escape, minimal)), re.IGNORECASE)
+
+
+def contains_pattern_coded(
+    codes: np.ndarray, uniques: Any, pattern: re.Pattern, index: pd.Index
+) -> pd.Series:
+    """
+    Boolean mask of rows whose factorized value contains a match for pattern.
+
+    The regex runs once per distinct value rather than once per row; statement
+    narratives repeat heavily (every charge row carries the same description).
+    Callers that filter the same column with several patterns factorize it
+    once and pay only the scan and a code lookup for each pattern.
+
+    Args:
+        codes: Per-row positions into uniques (-1 for missing), as from pd.factorize.
+        uniques: Distinct values.
+        pattern: Compiled pattern (see keyword_pattern).
+        index: Index of the returned mask.
+
+    Returns:
+        Boolean Series over index; missing values never match.
+    """
+    hits = pd.Series(uniques, dtype=object).str.contains(pattern, na=False).to_numpy(dtype=bool)
+    # Missing values get code -1, which picks the trailing False
+    return pd.Series(np.append(hits, False)[codes], index=index)
+
+
+def contains_pattern_any(frame: pd.DataFrame, pattern: re.Pattern) -> pd.Series:
+    """
+    Boolean mask of rows where any column of frame contains a match for pattern.
+
+    All columns share one set of distinct values, so the regex runs once per
+    distinct value across the whole frame (a reference repeated in the
+    narrative is only scanned once) instead of once per column.
+
+    Args:
+        frame: Columns to search.
+        pattern: Compiled pattern (see keyword_pattern).
+
+    Returns:
+        Boolean Series aligned to frame's index; missing values never match.
+    """
+    cells = pd.Series(frame.to_numpy(dtype=object).ravel(order="F"))
+    cell_hits = _map_distinct(cells, lambda text: text.str.contains(pattern, na=False), fill=False)
+    cell_hits = cell_hits.to_numpy(dtype=bool).reshape(frame.shape, order="F")
+    return pd.Series(cell_hits.any(axis=1), index=frame.index)
+
+
+def clean_amount_series(amounts: pd.Series) -> pd.Series:
+    """
+    Convert an amount column to absolute floats, missing/unparseable -> 0.
+
+    Text is stripped of everything except digits, '.' and '-' (currency symbols,
+    thousands separators, spaces) with a precompiled pattern and parsed once per
+    distinct text; statement amounts repeat heavily. Columns that are already
+    numeric skip the string round trip.
+
+    Args:
+        amounts: Raw Debit or Credit column.
+
+    Returns:
+        Float Series aligned to amounts.
+    """
+    if pd.api.types.is_float_dtype(amounts) or pd.api.types.is_integer_dtype(amounts):
+        numeric = pd.to_numeric(amounts, errors="coerce")
+    else:
+        numeric = _map_distinct(
+            amounts.astype(str),
+            lambda text: pd.to_numeric(
+                text.str.replace(NON_AMOUNT_CHARACTERS_PATTERN, "", regex=True), errors="coerce"
+            ),
+            fill=np.nan,
+        )
+    return numeric.fillna(0).abs()
+
+
+def format_dates(dates: pd.Series, date_format: str, missing: str = "") -> pd.Series:
+    """
+    Format datetime values as text, running strftime once per distinct date.
+
+    Statement and report rows share few distinct dates, so the unique values
+    are formatted and the strings broadcast back by code.
+
+    Args:
+        dates: Datetime Series (NaT for missing dates).
+        date_format: strftime format for the output text.
+        missing: Text used for missing dates.
+
+    Returns:
+        Object Series of formatted dates aligned to dates.
+    """
+    return _map_distinct(dates, lambda unique_dates: unique_dates.dt.strftime(date_format), fill=missing)
+
+
+def clean_string_series(series: pd.Series, convert: Callable[[Any], str]) -> pd.Series:
+    """
+    Column-wise version of a per-value clean-string converter.
+
+    Missing values become "", strings are stripped and whole-number floats
+    lose their ".0" (Excel reads numeric references as floats) without a Python
+    call per row. Anything else falls back to convert for just those values.
+
+    Args:
+        series: Column to clean.
+        convert: Scalar converter with the same rules, used as the fallback.
+
+    Returns:
+        Object Series of clean strings aligned to series.
+    """
+    result = pd.Series("", index=series.index, dtype=object)
+    present = series.notna()
+    if not present.any():
+        return result
+
+    values = series[present]
+    if pd.api.types.is_float_dtype(values):
+        text = values.astype(str)
+        whole = values == np.trunc(values)
+        # int64 covers any realistic reference; larger (and inf) go through convert
+        fits = whole & (values.abs() < 2 ** 63)
+        text[fits] = values[fits].astype("int64").astype(str)
+        needs_convert = whole & ~fits
+    elif pd.api.types.infer_dtype(values, skipna=False) == "string":
+        # Strip each distinct string once; repeated narratives then share a
+        # single string object instead of one stripped copy per row
+        text = _map_distinct(values, lambda text: text.str.strip())
+        needs_convert = pd.Series(False, index=values.index)
+    elif values.dtype == object:
+        # Mixed column (e.g. numeric references among text): strip the strings,
+        # convert the rest individually
+        is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+        text = values.astype(object)
+        text[is_text] = values[is_text].str.strip()
+        needs_convert = ~is_text
+    else:
+        text = values.astype(object)
+        needs_convert = pd.Series(True, index=values.index)
+
+    if needs_convert.any():
+        text = text.astype(object)
+        text[needs_convert] = values[needs_convert].map(convert)
+
+    result[present] = text
+    return result
+
 
 def normalize_column_names(df: pd.DataFrame, required_columns: List[str]) -> pd.DataFrame:
     """
@@ -87,10 +300,13 @@ class GatewayFile:
         self.gateway_name = gateway_name.lower().strip()
         self.data_loader = data_loader or DataLoader()
         self.dataframe: Optional[pd.DataFrame] = None
+        # Row masks (and factorized columns) shared by the get_* methods; reset whenever the dataframe changes
+        self._mask_cache: Dict[Hashable, Any] = {}
 
     def set_dataframe(self, df: pd.DataFrame) -> None:
         """Set the dataframe directly (useful for testing)."""
         self.dataframe = df
+        self._mask_cache = {}
 
     def load_data(self) -> None:
         """
@@ -100,12 +316,14 @@ class GatewayFile:
             ReadFileException: If no file found or error reading file.
         """
         try:
-            df = self.data_loader.load_gateway_data(self.gateway_name)
+            # Only the template columns are read; extra columns in the file are skipped
+            df = self.data_loader.load_gateway_data(self.gateway_name, columns=TEMPLATE_COLUMNS)
             if df.empty:
                 raise ReadFileException(
                     f"No data found for gateway '{self.gateway_name}'"
                 )
             self.dataframe = df
+            self._mask_cache = {}
         except ReadFileException:
             raise
         except Exception as e:
@@ -121,12 +339,15 @@ class GatewayFile:
             ReadFileException: If no files found or error reading files.
         """
         try:
-            dataframes = self.data_loader.load_all_gateway_data(self.gateway_name)
+            dataframes = self.data_loader.load_all_gateway_data(
+                self.gateway_name, columns=TEMPLATE_COLUMNS
+            )
             if not dataframes:
                 raise ReadFileException(
                     f"No data found for gateway '{self.gateway_name}'"
                 )
             self.dataframe = pd.concat(dataframes, ignore_index=True)
+            self._mask_cache = {}
         except ReadFileException:
             raise
         except Exception as e:
@@ -174,6 +395,7 @@ class GatewayFile:
         self._handle_date_column()
         self._handle_numeric_columns()
         self._handle_string_columns()
+        self._mask_cache = {}
         return self.dataframe
 
     def _handle_date_column(self) -> None:
@@ -186,27 +408,26 @@ class GatewayFile:
         if self.dataframe is None:
             raise ValueError("DataFrame not loaded.")
 
-        # Try expected format first
-        parsed = pd.to_datetime(
-            self.dataframe[DATE_COLUMN],
-            format=TEMPLATE_DATE_FORMAT,
-            errors="coerce"
-        )
-
-        # For any that failed, try automatic format inference
-        failed_mask = parsed.isna() & self.dataframe[DATE_COLUMN].notna()
-        if failed_mask.any():
-            parsed[failed_mask] = pd.to_datetime(
-                self.dataframe.loc[failed_mask, DATE_COLUMN],
-                dayfirst=True,
-                errors="coerce"
-            )
+        # Statements repeat the same date on many rows, so both parsing passes
+        # run over the distinct values only
+        def parse(unique_dates: pd.Series) -> pd.Series:
+            # Try expected format first
+            parsed = pd.to_datetime(unique_dates, format=TEMPLATE_DATE_FORMAT, errors="coerce")
+
+            # For any that failed, try automatic format inference
+            failed_mask = parsed.isna()
+            if failed_mask.any():
+                parsed[failed_mask] = pd.to_datetime(
+                    unique_dates[failed_mask],
+                    dayfirst=True,
+                    errors="coerce"
+                )
+            return parsed
 
-        # Fill any remaining unparseable dates with today
+        # Missing and unparseable dates default to today
         today = pd.Timestamp(date.today())
-        parsed = parsed.fillna(today)
-
-        self.dataframe[DATE_COLUMN] = parsed
+        parsed = _map_distinct(self.dataframe[DATE_COLUMN], parse, fill=pd.NaT)
+        self.dataframe[DATE_COLUMN] = parsed.fillna(today)
 
     def _handle_numeric_columns(self) -> None:
         """Convert Debit and Credit columns to numeric."""
@@ -214,15 +435,7 @@ class GatewayFile:
             raise ValueError("DataFrame not loaded.")
 
         for col in [DEBIT_COLUMN, CREDIT_COLUMN]:
-            self.dataframe[col] = (
-                self.dataframe[col]
-                .astype(str)
-                .str.strip()
-                .str.replace(r"[^\d\.-]", "", regex=True)
-            )
-            self.dataframe[col] = pd.to_numeric(
-                self.dataframe[col], errors="coerce"
-            ).fillna(0).abs()
+            self.dataframe[col] = clean_amount_series(self.dataframe[col])
 
     def _convert_to_clean_string(self, value) -> str:
         """
@@ -253,17 +466,17 @@ class GatewayFile:
             raise ValueError("DataFrame not loaded.")
 
         string_columns = [REFERENCE_COLUMN, DETAILS_COLUMN]
-        null_like_values = {"", "none", "null", "nan", "na"}
 
         for col in string_columns:
             if col in self.dataframe.columns:
                 # Apply clean string conversion (handles float -> int -> str)
-                self.dataframe[col] = self.dataframe[col].apply(self._convert_to_clean_string)
-                # Replace null-like string values with empty string
-                self.dataframe[col] = self.dataframe[col].where(
-                    ~self.dataframe[col].str.lower().isin(null_like_values),
-                    other=""
+                cleaned = clean_string_series(self.dataframe[col], self._convert_to_clean_string)
+                # Replace null-like string values with empty string, lower-casing each
+                # distinct value once; the column is written back once, after both steps
+                null_like = _map_distinct(
+                    cleaned, lambda text: text.str.lower().isin(NULL_LIKE_VALUES), fill=False
                 )
+                self.dataframe[col] = cleaned.where(~null_like.to_numpy(dtype=bool), other="")
 
     def fill_null_values(self) -> pd.DataFrame:
         """
@@ -282,21 +495,21 @@ class GatewayFile:
         if self.dataframe is None:
             self.normalize_data()
 
-        # Fill null dates with current date
-        current_date = pd.Timestamp(date.today())
-        self.dataframe[DATE_COLUMN] = self.dataframe[DATE_COLUMN].fillna(current_date)
-
-        # Fill null Reference and Details with "NA"
-        self.dataframe[REFERENCE_COLUMN] = self.dataframe[REFERENCE_COLUMN].replace("", "NA")
-        self.dataframe[REFERENCE_COLUMN] = self.dataframe[REFERENCE_COLUMN].fillna("NA")
-
-        self.dataframe[DETAILS_COLUMN] = self.dataframe[DETAILS_COLUMN].replace("", "NA")
-        self.dataframe[DETAILS_COLUMN] = self.dataframe[DETAILS_COLUMN].fillna("NA")
-
-        # Fill null Debit and Credit with 0
-        self.dataframe[DEBIT_COLUMN] = self.dataframe[DEBIT_COLUMN].fillna(0)
-        self.dataframe[CREDIT_COLUMN] = self.dataframe[CREDIT_COLUMN].fillna(0)
-
+        # Fill null dates with current date and null Debit/Credit with 0 in one call
+        # instead of three separate column rewrites
+        self.dataframe = self.dataframe.fillna({
+            DATE_COLUMN: pd.Timestamp(date.today()),
+            DEBIT_COLUMN: 0,
+            CREDIT_COLUMN: 0,
+        })
+
+        # Fill null or empty Reference and Details with "NA": one mask per column
+        # covers both cases, and only the missing rows are written
+        for col in [REFERENCE_COLUMN, DETAILS_COLUMN]:
+            values = self.dataframe[col]
+            self.dataframe[col] = values.where(values.notna() & (values != ""), "NA")
+
+        self._mask_cache = {}
         return self.dataframe
 
     @staticmethod
@@ -306,11 +519,21 @@ class GatewayFile:
 
         Converts to string, removes decimals, handles edge cases.
         """
-        if pd.isna(reference) or reference in ("", "NA", "na", "N/A"):
-            return "NA"
-
-        # Convert to string
-        ref_str = str(reference).strip()
+        # Strings are never NA, so the common case skips pd.isna
+        if isinstance(reference, str):
+            if reference in MISSING_REFERENCE_VALUES:
+                return "NA"
+            ref_str = reference.strip()
+        else:
+            if pd.isna(reference) or reference in MISSING_REFERENCE_VALUES:
+                return "NA"
+            # Convert to string
+            ref_str = str(reference).strip()
+
+        # Text references (e.g. "FT24001ABC") cannot parse as a number; skip the
+        # float() attempt and the exception it would raise
+        if NUMERIC_CANDIDATE_PATTERN.fullmatch(ref_str) is None:
+            return ref_str
 
         # Handle numeric references that might have decimals
         try:
@@ -349,6 +572,35 @@ class GatewayFile:
 
         return f"{clean_ref}|{clean_amount}|{clean_gateway}"
 
+    @staticmethod
+    def generate_reconciliation_keys(
+        references: pd.Series, amounts: pd.Series, base_gateway: str
+    ) -> pd.Series:
+        """
+        Vectorized generate_reconciliation_key over aligned reference/amount Series.
+
+        Key format: {reference}|{amount}|{base_gateway}
+        """
+        # Clean each distinct reference once; missing references clean to "NA"
+        clean_refs = _map_distinct(
+            references,
+            lambda refs: refs.map(GatewayFile.clean_reference_for_key).astype(object),
+            fill=GatewayFile.clean_reference_for_key(None),
+        )
+        # Absolute whole number, truncated (not rounded); missing amounts become 0.
+        # Amounts repeat (fixed charges, common payouts), so each distinct whole
+        # amount is stringified once
+        whole_amounts = (
+            pd.to_numeric(amounts, errors="coerce")
+            .fillna(0)
+            .abs()
+            .astype("int64")
+        )
+        clean_amounts = _map_distinct(whole_amounts, lambda whole: whole.astype(str).astype(object))
+        clean_gateway = base_gateway.lower().strip()
+
+        return clean_refs + "|" + clean_amounts + "|" + clean_gateway
+
     def add_reconciliation_keys(self, base_gateway: str, use_debit: bool = True) -> pd.DataFrame:
         """
         Add reconciliation keys to the dataframe.
@@ -364,30 +616,69 @@ class GatewayFile:
             self.normalize_data()
 
         amount_column = DEBIT_COLUMN if use_debit else CREDIT_COLUMN
+        fallback_column = CREDIT_COLUMN if use_debit else DEBIT_COLUMN
 
-        self.dataframe['reconciliation_key'] = self.dataframe.apply(
-            lambda row: self.generate_reconciliation_key(
-                row[REFERENCE_COLUMN],
-                row[amount_column] if row[amount_column] > 0 else row[CREDIT_COLUMN if use_debit else DEBIT_COLUMN],
-                base_gateway
-            ),
-            axis=1
+        # Preferred amount when positive, otherwise the other side (whole columns at once)
+        primary = self.dataframe[amount_column]
+        amounts = primary.where(primary > 0, self.dataframe[fallback_column])
+
+        self.dataframe['reconciliation_key'] = self.generate_reconciliation_keys(
+            self.dataframe[REFERENCE_COLUMN], amounts, base_gateway
         )
 
         return self.dataframe
 
+    def _cached_mask(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the mask stored under key, building it on first use."""
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            mask = build()
+            self._mask_cache[key] = mask
+        return mask
+
+    def _debit_mask(self) -> pd.Series:
+        """Rows with Debit > 0."""
+        return self._cached_mask(DEBIT_COLUMN, lambda: self.dataframe[DEBIT_COLUMN] > 0)
+
+    def _credit_mask(self) -> pd.Series:
+        """Rows with Credit > 0."""
+        return self._cached_mask(CREDIT_COLUMN, lambda: self.dataframe[CREDIT_COLUMN] > 0)
+
+    def _charge_keyword_mask(self, charge_keywords: List[str]) -> pd.Series:
+        """Rows whose Reference or Details contain any of the charge keywords."""
+        def build() -> pd.Series:
+            pattern = keyword_pattern(tuple(charge_keywords))
+
+            searched = self.dataframe[[DETAILS_COLUMN, REFERENCE_COLUMN]].astype(str)
+            return contains_pattern_any(searched, pattern)
+
+        return self._cached_mask(("charge_keywords", tuple(charge_keywords)), build)
+
+    def _narrative_codes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Details text factorized once per dataframe, as (codes, distinct values)."""
+        return self._cached_mask(
+            "narrative_codes", lambda: pd.factorize(self.dataframe[DETAILS_COLUMN].astype(str))
+        )
+
+    def _narrative_mask(self, keywords: List[str]) -> pd.Series:
+        """Rows whose Details contain any of the keywords (shared by include and exclude)."""
+        def build() -> pd.Series:
+            codes, uniques = self._narrative_codes()
+            return contains_pattern_coded(
+                codes, uniques, keyword_pattern(tuple(keywords)), self.dataframe.index
+            )
+
+        return self._cached_mask(("narrative_keywords", tuple(keywords)), build)
+
     def get_transaction_ids(self) -> set:
         """Get unique Reference (Transaction IDs) from the file."""
         if self.dataframe is None:
             self.normalize_data()
 
-        return set(
-            self.dataframe[REFERENCE_COLUMN]
-            .fillna("")
-            .astype(str)
-            .str.strip()
-            .loc[lambda x: x != ""]
-        )
+        # Strip each distinct reference once in a single pass rather than
+        # chaining fillna/astype/strip/filter over every row
+        references = self.dataframe[REFERENCE_COLUMN].dropna().unique()
+        return {text for text in (str(value).strip() for value in references) if text}
 
     def get_debits(self) -> pd.DataFrame:
         """Get all debit transactions (Debit > 0)."""
@@ -395,8 +686,7 @@ class GatewayFile:
             if self.dataframe is None:
                 self.normalize_data()
 
-            mask_debit = self.dataframe[DEBIT_COLUMN] > 0
-            return self.dataframe.loc[mask_debit].copy()
+            return self.dataframe.loc[self._debit_mask()].copy()
         except Exception as e:
             raise FileOperationsException("Error extracting debit transactions") from e
 
@@ -406,8 +696,7 @@ class GatewayFile:
             if self.dataframe is None:
                 self.normalize_data()
 
-            mask_credit = self.dataframe[CREDIT_COLUMN] > 0
-            return self.dataframe.loc[mask_credit].copy()
+            return self.dataframe.loc[self._credit_mask()].copy()
         except Exception as e:
             raise FileOperationsException("Error extracting credit transactions") from e
 
@@ -420,19 +709,11 @@ class GatewayFile:
                 self.normalize_data()
 
             if not charge_keywords:
-                return pd.DataFrame(columns=self.dataframe.columns)
-
-            regex_pattern = "|".join(map(re.escape, charge_keywords))
-
-            narrative_series = self.dataframe[DETAILS_COLUMN].astype(str)
-            reference_series = self.dataframe[REFERENCE_COLUMN].astype(str)
-
-            mask_narrative_keywords = narrative_series.str.contains(regex_pattern, case=False, na=False)
-            mask_reference_keywords = reference_series.str.contains(regex_pattern, case=False, na=False)
-            mask_keywords = mask_narrative_keywords | mask_reference_keywords
-            mask_debits = self.dataframe[DEBIT_COLUMN] > 0
+                # Zero-row frame keeps the column dtypes; no new frame to build and infer
+                return self.dataframe.iloc[:0].copy()
 
-            return self.dataframe.loc[mask_keywords & mask_debits].copy()
+            mask_keywords = self._charge_keyword_mask(charge_keywords)
+            return self.dataframe.loc[mask_keywords & self._debit_mask()].copy()
         except Exception as e:
             raise FileOperationsException("Error extracting charge transactions") from e
 
@@ -442,20 +723,12 @@ class GatewayFile:
             if self.dataframe is None:
                 self.normalize_data()
 
-            mask_debits = self.dataframe[DEBIT_COLUMN] > 0
+            mask_debits = self._debit_mask()
 
             if not charge_keywords:
                 return self.dataframe.loc[mask_debits].copy()
 
-            regex_pattern = "|".join(map(re.escape, charge_keywords))
-
-            narrative_series = self.dataframe[DETAILS_COLUMN].astype(str)
-            reference_series = self.dataframe[REFERENCE_COLUMN].astype(str)
-
-            mask_narrative_charges = narrative_series.str.contains(regex_pattern, case=False, na=False)
-            mask_reference_charges = reference_series.str.contains(regex_pattern, case=False, na=False)
-            mask_charges = mask_narrative_charges | mask_reference_charges
-
+            mask_charges = self._charge_keyword_mask(charge_keywords)
             return self.dataframe.loc[mask_debits & ~mask_charges].copy()
         except Exception as e:
             raise FileOperationsException("Error extracting non-charge debit transactions") from e
@@ -466,8 +739,7 @@ class GatewayFile:
             if self.dataframe is None:
                 self.normalize_data()
 
-            mask_debits = self.dataframe[DEBIT_COLUMN] > 0
-            return self.dataframe.loc[mask_debits].copy()
+            return self.dataframe.loc[self._debit_mask()].copy()
         except Exception as e:
             raise FileOperationsException("Error extracting payout transactions") from e
 
@@ -480,9 +752,7 @@ class GatewayFile:
             if not keywords:
                 return self.dataframe.copy()
 
-            regex_pattern = "|".join(map(re.escape, keywords))
-            narrative_series = self.dataframe[DETAILS_COLUMN].astype(str)
-            mask = narrative_series.str.contains(regex_pattern, case=False, na=False)
+            mask = self._narrative_mask(keywords)
 
             if include:
                 return self.dataframe.loc[mask].copy()
@@ -496,8 +766,9 @@ class GatewayFile:
         if self.dataframe is None:
             self.normalize_data()
 
-        total_credits = self.dataframe[CREDIT_COLUMN].sum()
-        total_debits = self.dataframe[DEBIT_COLUMN].sum()
+        totals = self.dataframe[[CREDIT_COLUMN, DEBIT_COLUMN]].sum()
+        total_credits = totals[CREDIT_COLUMN]
+        total_debits = totals[DEBIT_COLUMN]
 
         return {
             "gateway": self.gateway_name,
@@ -505,6 +776,7 @@ class GatewayFile:
             "total_credits": float(total_credits),
             "total_debits": float(total_debits),
             "net_amount": float(total_credits - total_debits),
-            "credit_count": int((self.dataframe[CREDIT_COLUMN] > 0).sum()),
-            "debit_count": int((self.dataframe[DEBIT_COLUMN] > 0).sum()),
+            # Same cached masks as get_credits/get_debits
+            "credit_count": int(self._credit_mask().sum()),
+            "debit_count": int(self._debit_mask().sum()),
         }
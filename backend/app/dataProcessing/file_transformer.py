@@ -14,6 +14,15 @@ from dataclasses import dataclass
 
 import pandas as pd
 
+from app.dataProcessing.GatewayFileClass import (
+    _map_distinct,
+    clean_amount_series,
+    clean_string_series,
+    contains_pattern_any,
+    format_dates,
+    keyword_pattern,
+)
+from app.storage.base import XLSX_ENGINE, XLS_ENGINE
 from app.upload.template_generator import (
     DATE_COLUMN,
     REFERENCE_COLUMN,
@@ -105,6 +114,44 @@ class FileTransformer:
         self.header_row_config = header_row_config or {"xlsx": 0, "xls": 0, "csv": 0}
         self.end_of_data_signal = end_of_data_signal
         self.date_format = date_format
+        # Lower-cased candidate raw names per template column (the template name
+        # itself first), resolved once instead of on every transform
+        self._column_candidates = self._build_column_candidates(self.column_mapping)
+        # Reader per supported extension
+        self._readers = {
+            ".xlsx": self._read_xlsx,
+            ".xls": self._read_xls,
+            ".csv": self._read_csv,
+        }
+
+    @staticmethod
+    def _build_column_candidates(
+        column_mapping: Dict[str, List[str]]
+    ) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """
+        Resolve the column mapping into lower-cased candidate names per template column.
+
+        Args:
+            column_mapping: Mapping from template columns to possible raw column names.
+
+        Returns:
+            Tuple of (template_column, candidate_names) in TEMPLATE_COLUMNS order.
+        """
+        candidates = []
+        for template_col in TEMPLATE_COLUMNS:
+            possible_names = column_mapping.get(template_col, [])
+
+            # Ensure possible_names is a list and convert all values to strings
+            if not isinstance(possible_names, list):
+                possible_names = [possible_names] if possible_names else []
+
+            # Add the template column name itself as a possibility
+            # Convert all values to strings before calling .lower() to handle accidental int values
+            candidates.append((
+                template_col,
+                tuple([template_col.lower()] + [str(n).lower() for n in possible_names]),
+            ))
+        return tuple(candidates)
 
     def transform(self, content: bytes, filename: str) -> TransformationResult:
         """
@@ -122,7 +169,7 @@ class FileTransformer:
         try:
             # Determine file type
             ext = self._get_extension(filename)
-            if ext not in [".xlsx", ".xls", ".csv"]:
+            if ext not in self._readers:
                 result.errors.append(f"Unsupported file type: {ext}")
                 return result
 
@@ -181,28 +228,34 @@ class FileTransformer:
         ext_key = ext.lstrip(".")
         return self.header_row_config.get(ext_key, 0)
 
+    def _read_xlsx(self, buffer: BytesIO, skip_rows: int) -> pd.DataFrame:
+        """Read XLSX content using XLSX_ENGINE (calamine, or openpyxl without python-calamine)."""
+        return pd.read_excel(buffer, engine=XLSX_ENGINE, skiprows=skip_rows)
+
+    def _read_xls(self, buffer: BytesIO, skip_rows: int) -> pd.DataFrame:
+        """Read XLS content. Tries XLSX_ENGINE first, falls back to xlrd."""
+        try:
+            return pd.read_excel(buffer, engine=XLSX_ENGINE, skiprows=skip_rows)
+        except Exception:
+            buffer.seek(0)
+            return pd.read_excel(buffer, engine=XLS_ENGINE, skiprows=skip_rows)
+
+    def _read_csv(self, buffer: BytesIO, skip_rows: int) -> pd.DataFrame:
+        """Read CSV content."""
+        return pd.read_csv(buffer, skiprows=skip_rows)
+
     def _read_file(self, content: bytes, ext: str, skip_rows: int) -> Optional[pd.DataFrame]:
         """Read file content into DataFrame."""
-        try:
-            buffer = BytesIO(content)
-
-            if ext == ".xlsx":
-                return pd.read_excel(buffer, engine="openpyxl", skiprows=skip_rows)
-            elif ext == ".xls":
-                try:
-                    return pd.read_excel(buffer, engine="openpyxl", skiprows=skip_rows)
-                except Exception:
-                    buffer.seek(0)
-                    return pd.read_excel(buffer, engine="xlrd", skiprows=skip_rows)
-            elif ext == ".csv":
-                return pd.read_csv(buffer, skiprows=skip_rows)
+        reader = self._readers.get(ext)
+        if reader is None:
+            return None
 
+        try:
+            return reader(BytesIO(content), skip_rows)
         except Exception as e:
             logger.error(f"Error reading file: {str(e)}")
             return None
 
-        return None
-
     def _truncate_at_signal(self, df: pd.DataFrame) -> pd.DataFrame:
         """Truncate DataFrame at end_of_data_signal if configured."""
         if not self.end_of_data_signal:
@@ -210,13 +263,16 @@ class FileTransformer:
 
         signal = self.end_of_data_signal.lower().strip()
 
-        # Check each row for the signal in any column
-        for idx, row in df.iterrows():
-            for col in df.columns:
-                cell_value = str(row[col]).lower().strip() if pd.notna(row[col]) else ""
-                if signal in cell_value:
-                    logger.info(f"Found end_of_data_signal at row {idx}")
-                    return df.iloc[:idx]
+        # Flag rows where any column contains the signal (case-insensitive, empty
+        # cells never match); each distinct cell text is searched once for the
+        # whole frame rather than once per column
+        cell_text = df.astype(str).where(df.notna())
+        signal_rows = contains_pattern_any(cell_text, keyword_pattern((signal,))).to_numpy()
+
+        if signal_rows.any():
+            position = int(signal_rows.argmax())
+            logger.info(f"Found end_of_data_signal at row {df.index[position]}")
+            return df.iloc[:position]
 
         return df
 
@@ -231,28 +287,19 @@ class FileTransformer:
         """
         mapping_used = {}
         mapped_raw_cols = set()
+        renames = {}
 
         # Normalize column names for matching (convert to string first to handle integer column names)
         raw_columns_lower = {str(col).lower().strip(): col for col in df.columns}
 
         # For each template column, find a matching raw column
-        for template_col in TEMPLATE_COLUMNS:
-            possible_names = self.column_mapping.get(template_col, [])
-
-            # Ensure possible_names is a list and convert all values to strings
-            if not isinstance(possible_names, list):
-                possible_names = [possible_names] if possible_names else []
-
-            # Add the template column name itself as a possibility
-            # Convert all values to strings before calling .lower() to handle accidental int values
-            all_possibilities = [template_col.lower()] + [str(n).lower() for n in possible_names]
-
+        for template_col, all_possibilities in self._column_candidates:
             matched = False
             for possible_name in all_possibilities:
                 if possible_name in raw_columns_lower:
                     raw_col = raw_columns_lower[possible_name]
-                    if raw_col != template_col:
-                        df = df.rename(columns={raw_col: template_col})
+                    if raw_col != template_col and raw_col not in renames:
+                        renames[raw_col] = template_col
                     mapping_used[template_col] = raw_col
                     mapped_raw_cols.add(raw_col)
                     matched = True
@@ -261,6 +308,10 @@ class FileTransformer:
             if not matched:
                 logger.warning(f"Could not find mapping for template column: {template_col}")
 
+        # Rename all matched columns in one pass instead of copying the frame per column
+        if renames:
+            df = df.rename(columns=renames)
+
         # Find unmapped raw columns
         unmapped = [col for col in df.columns if col not in mapped_raw_cols and col not in TEMPLATE_COLUMNS]
 
@@ -300,31 +351,31 @@ class FileTransformer:
 
     def _normalize_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Normalize data types and values."""
-        # Keep only template columns
-        df = df[TEMPLATE_COLUMNS].copy()
+        # Keep only template columns (a new frame, so the caller's frame is left intact)
+        df = df[TEMPLATE_COLUMNS]
+        cleaned = {}
 
         # Normalize numeric columns
         for col in [DEBIT_COLUMN, CREDIT_COLUMN]:
-            df[col] = (
-                df[col]
-                .astype(str)
-                .str.strip()
-                .str.replace(r"[^\d\.-]", "", regex=True)
-            )
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).abs()
+            cleaned[col] = clean_amount_series(df[col])
 
         # Clean string columns
         for col in [REFERENCE_COLUMN, DETAILS_COLUMN]:
-            df[col] = df[col].apply(self._convert_to_clean_string)
+            cleaned[col] = clean_string_series(df[col], self._convert_to_clean_string)
 
         # Handle Date column - keep as-is for now (will be parsed during reconciliation)
-        df[DATE_COLUMN] = df[DATE_COLUMN].apply(self._clean_date_value)
+        cleaned[DATE_COLUMN] = self._clean_date_column(df[DATE_COLUMN])
+
+        # Build the normalized frame once from the cleaned columns; assigning them
+        # back one by one would copy the shared raw column block on the first write
+        df = pd.DataFrame({col: cleaned[col] for col in TEMPLATE_COLUMNS}, index=df.index)
 
         # Remove rows where all transaction values are empty/zero
+        # (Reference is already stripped by clean_string_series)
         mask = (
             (df[DEBIT_COLUMN] > 0) |
             (df[CREDIT_COLUMN] > 0) |
-            (df[REFERENCE_COLUMN].str.strip() != "")
+            (df[REFERENCE_COLUMN] != "")
         )
         df = df[mask]
 
@@ -345,6 +396,35 @@ class FileTransformer:
 
         return str(value)
 
+    def _clean_date_column(self, dates: pd.Series) -> pd.Series:
+        """
+        Clean a whole Date column for output (see _clean_date_value).
+
+        Columns that are all dates (Excel date cells) are formatted once per
+        distinct date and all-text columns stripped once per distinct text;
+        only mixed columns fall back to cleaning value by value.
+        """
+        result = pd.Series("", index=dates.index, dtype=object)
+        present = dates.notna()
+        if not present.any():
+            return result
+
+        values = dates[present]
+        kind = pd.api.types.infer_dtype(values, skipna=False)
+        if kind in ("datetime64", "datetime", "date"):
+            try:
+                result[present] = format_dates(pd.to_datetime(values), "%Y-%m-%d")
+                return result
+            except (ValueError, TypeError, OverflowError):
+                pass
+        elif kind == "string":
+            # Statement rows share few distinct date strings; strip each once
+            result[present] = _map_distinct(values, lambda text: text.str.strip())
+            return result
+
+        result[present] = values.map(self._clean_date_value)
+        return result
+
     def _clean_date_value(self, value) -> str:
         """Clean date value for output."""
         if pd.isna(value):
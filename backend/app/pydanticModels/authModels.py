@@ -3,6 +3,7 @@ Pydantic models for authentication and user management.
 
 Includes models for login, forgot password, user management, and audit logging.
 """
+import re
 from datetime import datetime
 from typing import Optional, List, Any, Literal
 from enum import Enum
@@ -11,6 +12,10 @@ from pydantic import BaseModel, EmailStr, field_validator
 
 from app.auth.config import validate_password_strength, auth_settings
 
+# E.164 phone number, or basic numeric with optional leading +; compiled once
+# for every user create/update request
+MOBILE_NUMBER_PATTERN = re.compile(r'^\+?[1-9]\d{6,14}$')
+
 
 class UserRoleEnum(str, Enum):
     """User roles for API requests."""
@@ -204,8 +209,7 @@ class UserCreateRequest(BaseModel):
         if not v:
             return None
         # Accept E.164 format or basic numeric with optional leading +
-        import re
-        if not re.match(r'^\+?[1-9]\d{6,14}$', v):
+        if not MOBILE_NUMBER_PATTERN.match(v):
             raise ValueError('Mobile number must be in E.164 format (e.g., +254712345678)')
         return v
 
@@ -232,8 +236,7 @@ class UserUpdateRequest(BaseModel):
         v = v.strip()
         if not v:
             return None
-        import re
-        if not re.match(r'^\+?[1-9]\d{6,14}$', v):
+        if not MOBILE_NUMBER_PATTERN.match(v):
             raise ValueError('Mobile number must be in E.164 format (e.g., +254712345678)')
         return v
 
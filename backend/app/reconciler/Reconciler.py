@@ -14,12 +14,19 @@ from typing import Optional, List, Tuple, Set
 
 import pandas as pd
 import numpy as np
-from sqlalchemy import select, and_, or_, update
+from pydantic import TypeAdapter
+from sqlalchemy import select, and_, or_, update, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.exceptions.exceptions import ReconciliationException, DbOperationException
-from app.dataProcessing.GatewayFileClass import GatewayFile
+from app.dataProcessing.GatewayFileClass import (
+    GatewayFile,
+    keyword_pattern,
+    contains_pattern_any,
+    format_dates,
+)
 from app.dataLoading.data_loader import DataLoader
 from app.sqlModels.transactionEntities import Transaction, TransactionType, ReconciliationCategory
 from app.sqlModels.runEntities import ReconciliationRun
@@ -56,12 +63,24 @@ IS_MANUAL_COLUMN = "is_manually_reconciled"
 STATUS_RECONCILED = "reconciled"
 STATUS_UNRECONCILED = "unreconciled"
 
+# Status categories; a row's code is 1 when matched, so the match mask is the code array
+RECONCILIATION_STATUS_CATEGORIES = [STATUS_UNRECONCILED, STATUS_RECONCILED]
+
 # Reconciliation note for system auto-matched transactions
 SYSTEM_RECONCILED_NOTE = "System Reconciled"
 SYSTEM_RECONCILED_DEPOSIT_NOTE = "System Reconciled - Deposit"
 SYSTEM_RECONCILED_CHARGE_NOTE = "System Reconciled - Charge"
 SYSTEM_RECONCILED_REFUND_NOTE = "Stored - Refund (Non-reconcilable)"
 
+# Validates a whole batch of rows in one pydantic-core call instead of one model per row
+TRANSACTION_CREATE_LIST_ADAPTER = TypeAdapter(List[TransactionCreate])
+
+# Rows per multi-row INSERT (larger batches mean fewer round trips)
+SAVE_BATCH_SIZE = 10_000
+
+# Keys per IN (...) lookup of existing keys (keeps each lookup statement small)
+KEY_LOOKUP_BATCH_SIZE = 1000
+
 
 def generate_run_id() -> str:
     """Generate a unique run ID: RUN-YYYYMMDD-HHMMSS-shortid."""
@@ -360,8 +379,6 @@ class Reconciler:
         - carry_forward_external_keys: unreconciled external debit keys
         - carry_forward_internal_keys: unreconciled internal payout keys
         """
-        import re
-
         try:
             # Load ALL unreconciled transactions for this gateway (not just reconcilable)
             stmt = select(
@@ -391,46 +408,37 @@ class Reconciler:
                 )
             )
 
-            rows = self.db_session.execute(stmt).all()
-
-            reclassified_charge_ids: List[int] = []
-
-            for row in rows:
-                txn_id, recon_key, gw, txn_type, recon_cat, narrative, reference = row
-
-                if gw == self.external_gateway_id:
-                    # Re-evaluate external transactions through charge keyword engine
-                    if self.charge_keywords and txn_type in (
-                        TransactionType.DEBIT.value,
-                        TransactionType.CHARGE.value,
-                    ):
-                        is_charge = False
-                        if self.charge_keywords:
-                            regex_pattern = "|".join(map(re.escape, self.charge_keywords))
-                            details_str = str(narrative or "")
-                            ref_str = str(reference or "")
-                            if (re.search(regex_pattern, details_str, re.IGNORECASE) or
-                                    re.search(regex_pattern, ref_str, re.IGNORECASE)):
-                                is_charge = True
-
-                        if is_charge and txn_type != TransactionType.CHARGE.value:
-                            # Reclassify: was a debit, should be a charge → auto-reconcile
-                            reclassified_charge_ids.append(txn_id)
-                            # Don't add to carry-forward keys — it's now reconciled
-                            continue
-
-                        if is_charge and txn_type == TransactionType.CHARGE.value:
-                            # Already a charge but unreconciled — auto-reconcile it
-                            reclassified_charge_ids.append(txn_id)
-                            continue
-
-                    # Not a charge → add to carry-forward for matching
-                    if recon_cat == ReconciliationCategory.RECONCILABLE.value:
-                        self.carry_forward_external_keys.add(recon_key)
-
-                elif gw == self.internal_gateway_id:
-                    if recon_cat == ReconciliationCategory.RECONCILABLE.value:
-                        self.carry_forward_internal_keys.add(recon_key)
+            rows = pd.DataFrame(
+                self.db_session.execute(stmt).all(),
+                columns=["id", "key", "gateway", "type", "category", "narrative", "reference"],
+            )
+
+            is_external = rows["gateway"] == self.external_gateway_id
+            is_internal = rows["gateway"] == self.internal_gateway_id
+            is_reconcilable = rows["category"] == ReconciliationCategory.RECONCILABLE.value
+
+            # Re-evaluate external debits/charges through the charge keyword engine:
+            # matches are auto-reconciled (debits get reclassified as charges) and
+            # stay out of the carry-forward keys. The keyword scan only runs over
+            # external debit/charge rows; deposits and internal rows can never match
+            is_charge = pd.Series(False, index=rows.index)
+            if self.charge_keywords:
+                pattern = keyword_pattern(tuple(self.charge_keywords))
+                candidates = is_external & rows["type"].isin(
+                    [TransactionType.DEBIT.value, TransactionType.CHARGE.value]
+                )
+                is_charge = contains_pattern_any(
+                    rows.loc[candidates, ["narrative", "reference"]].fillna(""), pattern
+                ).reindex(rows.index, fill_value=False)
+            reclassified_charge_ids: List[int] = rows.loc[is_charge, "id"].tolist()
+
+            # Not a charge → add to carry-forward for matching
+            self.carry_forward_external_keys.update(
+                rows.loc[is_external & ~is_charge & is_reconcilable, "key"]
+            )
+            self.carry_forward_internal_keys.update(
+                rows.loc[is_internal & is_reconcilable, "key"]
+            )
 
             # Batch-update reclassified charges to reconciled
             # NOTE: Do NOT update run_id here — the run record hasn't been created yet
@@ -488,27 +496,60 @@ class Reconciler:
         reconciliation_note: Optional[str] = None,
         source_file: Optional[str] = None
     ) -> pd.DataFrame:
-        """Add metadata columns to the dataframe."""
-        df = df.copy()
-        df[GATEWAY_COLUMN] = gateway_id
-        df[GATEWAY_TYPE_COLUMN] = Transaction.get_gateway_type(gateway_id)
-        df[TRANSACTION_TYPE_COLUMN] = transaction_type
-        df[RECONCILIATION_CATEGORY_COLUMN] = Transaction.get_reconciliation_category(transaction_type)
-        df[RECONCILIATION_STATUS_COLUMN] = reconciliation_status
+        """
+        Add metadata columns to the dataframe.
+
+        The frame is modified in place: load_dataframes passes the frames the
+        GatewayFile getters return, which are already copies of the source file's
+        dataframe, so copying again here would only materialize every row twice.
+
+        Columns holding one value for the whole frame are stored as categoricals
+        (a single category plus one int8 code per row) rather than a Python
+        string reference per row. The status column is a categorical over
+        RECONCILIATION_STATUS_CATEGORIES.
+
+        Raises:
+            ReconciliationException: If reconciliation_status is not one of
+                RECONCILIATION_STATUS_CATEGORIES.
+        """
+        df[GATEWAY_COLUMN] = self._constant_column(gateway_id, len(df))
+        df[GATEWAY_TYPE_COLUMN] = self._constant_column(Transaction.get_gateway_type(gateway_id), len(df))
+        df[TRANSACTION_TYPE_COLUMN] = self._constant_column(transaction_type, len(df))
+        df[RECONCILIATION_CATEGORY_COLUMN] = self._constant_column(
+            Transaction.get_reconciliation_category(transaction_type), len(df)
+        )
+        # Status codes are filled directly, without a per-row list of strings to hash
+        if reconciliation_status not in RECONCILIATION_STATUS_CATEGORIES:
+            raise ReconciliationException(
+                f"Unknown reconciliation status '{reconciliation_status}', "
+                f"expected one of {RECONCILIATION_STATUS_CATEGORIES}"
+            )
+        df[RECONCILIATION_STATUS_COLUMN] = pd.Categorical.from_codes(
+            np.full(len(df), RECONCILIATION_STATUS_CATEGORIES.index(reconciliation_status), dtype=np.int8),
+            categories=RECONCILIATION_STATUS_CATEGORIES,
+        )
+        # Note is overwritten per row for matched transactions, so it stays object
         df[RECONCILIATION_NOTE_COLUMN] = reconciliation_note
-        df[RUN_ID_COLUMN] = self.run_id
-        df[SOURCE_FILE_COLUMN] = source_file
+        df[RUN_ID_COLUMN] = self._constant_column(self.run_id, len(df))
+        df[SOURCE_FILE_COLUMN] = self._constant_column(source_file, len(df))
         df[IS_MANUAL_COLUMN] = None
         return df
 
-    def _generate_reconciliation_key(
+    @staticmethod
+    def _constant_column(value: Optional[str], length: int):
+        """Categorical repeating value on every row, or None when there is no value."""
+        if value is None:
+            return None
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+    def _generate_reconciliation_keys(
         self,
-        row: pd.Series,
+        df: pd.DataFrame,
         use_debit: bool = True,
         include_date: bool = False,
-    ) -> str:
+    ) -> pd.Series:
         """
-        Generate reconciliation key for a transaction row.
+        Generate reconciliation keys for every transaction row.
 
         For reconcilable transactions (debits/payouts) the key is:
             {reference}|{amount}|{base_gateway}
@@ -520,31 +561,28 @@ class Reconciler:
         cross-run duplicates when they are actually new transactions.
             {reference}|{amount}|{base_gateway}|{YYYYMMDD}
         """
-        reference = row.get(REFERENCE_COLUMN, "")
-        debit = row.get(DEBIT_COLUMN, 0) or 0
-        credit = row.get(CREDIT_COLUMN, 0) or 0
-
-        if use_debit and debit > 0:
-            amount = debit
-        elif credit > 0:
-            amount = credit
+        # Nothing to key: skip the amount, reference and date normalization passes
+        if df.empty:
+            return pd.Series(index=df.index, dtype=object)
+
+        debit = df[DEBIT_COLUMN].fillna(0)
+        credit = df[CREDIT_COLUMN].fillna(0)
+
+        # Preferred side if positive, otherwise the other side
+        if use_debit:
+            amount = debit.where(debit > 0, credit)
         else:
-            amount = debit if debit > 0 else credit
+            amount = credit.where(credit > 0, debit.where(debit > 0, credit))
 
-        base_key = GatewayFile.generate_reconciliation_key(reference, amount, self.gateway)
+        keys = GatewayFile.generate_reconciliation_keys(df[REFERENCE_COLUMN], amount, self.gateway)
 
         if include_date:
-            date_val = row.get(DATE_COLUMN)
-            if date_val is not None and not pd.isna(date_val):
-                try:
-                    date_str = pd.Timestamp(date_val).strftime("%Y%m%d")
-                except Exception:
-                    date_str = "nodate"
-            else:
-                date_str = "nodate"
-            return f"{base_key}|{date_str}"
-
-        return base_key
+            date_str = format_dates(
+                pd.to_datetime(df[DATE_COLUMN], errors="coerce"), "%Y%m%d", missing="nodate"
+            )
+            return keys + "|" + date_str
+
+        return keys
 
     def _add_reconciliation_keys(
         self,
@@ -552,12 +590,8 @@ class Reconciler:
         use_debit: bool = True,
         include_date: bool = False,
     ) -> pd.DataFrame:
-        """Add reconciliation keys to the dataframe."""
-        df = df.copy()
-        df[RECONCILIATION_KEY_COLUMN] = df.apply(
-            lambda row: self._generate_reconciliation_key(row, use_debit, include_date),
-            axis=1
-        )
+        """Add reconciliation keys to the dataframe (in place, see _add_metadata_columns)."""
+        df[RECONCILIATION_KEY_COLUMN] = self._generate_reconciliation_keys(df, use_debit, include_date)
         return df
 
     @staticmethod
@@ -576,20 +610,18 @@ class Reconciler:
         if df is None or df.empty:
             return df
 
-        df = df.copy()
         key_col = RECONCILIATION_KEY_COLUMN
-        seen: dict = {}
-        new_keys = []
-
-        for key in df[key_col]:
-            if key in seen:
-                seen[key] += 1
-                new_keys.append(f"{key}|{seen[key]}")
-            else:
-                seen[key] = 0
-                new_keys.append(key)
-
-        df[key_col] = new_keys
+        keys = df[key_col]
+
+        # 0 for the first occurrence of each key, 1, 2, ... for later repeats
+        occurrence = keys.groupby(keys, sort=False, dropna=False).cumcount()
+        is_repeat = occurrence > 0
+
+        if is_repeat.any():
+            df[key_col] = keys.where(
+                ~is_repeat,
+                keys.astype(str) + "|" + occurrence.astype(str)
+            )
         return df
 
     def load_dataframes(self) -> None:
@@ -684,16 +716,19 @@ class Reconciler:
         if df is None or df.empty:
             return []
 
-        valid_df = df[
+        # Only the key column is counted, so select it alone rather than
+        # copying every column of the matching rows
+        valid_keys = df.loc[
             (df[REFERENCE_COLUMN] != "NA") &
             (df[REFERENCE_COLUMN] != "") &
-            (df[RECONCILIATION_KEY_COLUMN].notna())
+            (df[RECONCILIATION_KEY_COLUMN].notna()),
+            RECONCILIATION_KEY_COLUMN
         ]
 
-        if valid_df.empty:
+        if valid_keys.empty:
             return []
 
-        key_counts = valid_df[RECONCILIATION_KEY_COLUMN].value_counts()
+        key_counts = valid_keys.value_counts()
         duplicates = key_counts[key_counts > 1]
 
         return [(key, count, source_name) for key, count in duplicates.items()]
@@ -776,65 +811,72 @@ class Reconciler:
         if self.external_debits is None or self.internal_payouts is None:
             self.load_dataframes()
 
-        external_df = self.external_debits.copy()
-        internal_df = self.internal_payouts.copy()
+        # Status columns are updated in place; the frames are owned by this
+        # reconciler (built in load_dataframes), so no defensive copy is needed
+        external_df = self.external_debits
+        internal_df = self.internal_payouts
 
-        # Get reconciliation keys from new file data (exclude "NA" references)
-        new_external_keys = set(
-            external_df.loc[
-                (external_df[REFERENCE_COLUMN] != "NA") &
-                (external_df[REFERENCE_COLUMN] != ""),
-                RECONCILIATION_KEY_COLUMN
-            ]
+        # Rows with a usable reference; computed once and reused for key sets and match masks
+        external_has_ref = (
+            (external_df[REFERENCE_COLUMN] != "NA") &
+            (external_df[REFERENCE_COLUMN] != "")
         )
-        new_internal_keys = set(
-            internal_df.loc[
-                (internal_df[REFERENCE_COLUMN] != "NA") &
-                (internal_df[REFERENCE_COLUMN] != ""),
-                RECONCILIATION_KEY_COLUMN
-            ]
+        internal_has_ref = (
+            (internal_df[REFERENCE_COLUMN] != "NA") &
+            (internal_df[REFERENCE_COLUMN] != "")
         )
 
-        # Combine with carry-forward keys for matching
-        all_external_keys = new_external_keys | self.carry_forward_external_keys
-        all_internal_keys = new_internal_keys | self.carry_forward_internal_keys
-
-        # Find matched keys (new + carry-forward combined)
-        matched_keys = all_external_keys.intersection(all_internal_keys)
+        # Encode every key (new file data and carry-forward) as an integer code over
+        # one shared vocabulary, so matching is a presence-table lookup per row
+        # instead of repeated hash-based isin() calls
+        carry_forward_external = pd.Series(list(self.carry_forward_external_keys), dtype=object)
+        carry_forward_internal = pd.Series(list(self.carry_forward_internal_keys), dtype=object)
+        key_groups = [
+            external_df[RECONCILIATION_KEY_COLUMN],
+            internal_df[RECONCILIATION_KEY_COLUMN],
+            carry_forward_external,
+            carry_forward_internal,
+        ]
+        codes, uniques = pd.factorize(pd.concat(key_groups, ignore_index=True))
+        external_codes, internal_codes, cf_external_codes, cf_internal_codes = np.split(
+            codes, np.cumsum([len(group) for group in key_groups[:-1]])
+        )
 
-        # Track which carry-forward keys got matched in this run
-        self.carry_forward_matched_keys = set()
-        for key in matched_keys:
-            if key in self.carry_forward_external_keys or key in self.carry_forward_internal_keys:
-                self.carry_forward_matched_keys.add(key)
+        # Presence tables indexed by code; the extra last slot holds the -1 (missing) code.
+        # New file keys only count when the row has a usable reference.
+        on_external = np.zeros(len(uniques) + 1, dtype=bool)
+        on_external[external_codes[external_has_ref.to_numpy()]] = True
+        on_external[cf_external_codes] = True
+        on_internal = np.zeros(len(uniques) + 1, dtype=bool)
+        on_internal[internal_codes[internal_has_ref.to_numpy()]] = True
+        on_internal[cf_internal_codes] = True
+
+        # Track which carry-forward keys got matched in this run (both sides are
+        # de-duplicated together at C level, so the set is built in one pass)
+        self.carry_forward_matched_keys = set(pd.unique(np.concatenate([
+            carry_forward_external[on_internal[cf_external_codes]].to_numpy(),
+            carry_forward_internal[on_external[cf_internal_codes]].to_numpy(),
+        ])))
 
         # Update internal records based on matches
-        internal_matched_mask = (
-            internal_df[RECONCILIATION_KEY_COLUMN].isin(matched_keys) &
-            (internal_df[REFERENCE_COLUMN] != "NA") &
-            (internal_df[REFERENCE_COLUMN] != "")
+        # (status is rebuilt from the mask as categorical codes in one step)
+        internal_matched_mask = internal_has_ref & on_external[internal_codes]
+        internal_df[RECONCILIATION_STATUS_COLUMN] = pd.Categorical.from_codes(
+            internal_matched_mask.to_numpy(dtype=np.int8), categories=RECONCILIATION_STATUS_CATEGORIES
         )
-        internal_df.loc[internal_matched_mask, RECONCILIATION_STATUS_COLUMN] = STATUS_RECONCILED
         internal_df.loc[internal_matched_mask, RECONCILIATION_NOTE_COLUMN] = SYSTEM_RECONCILED_NOTE
-        internal_df.loc[~internal_matched_mask, RECONCILIATION_STATUS_COLUMN] = STATUS_UNRECONCILED
 
         # Update external records based on matches
-        external_matched_mask = (
-            external_df[RECONCILIATION_KEY_COLUMN].isin(matched_keys) &
-            (external_df[REFERENCE_COLUMN] != "NA") &
-            (external_df[REFERENCE_COLUMN] != "")
+        external_matched_mask = external_has_ref & on_internal[external_codes]
+        external_df[RECONCILIATION_STATUS_COLUMN] = pd.Categorical.from_codes(
+            external_matched_mask.to_numpy(dtype=np.int8), categories=RECONCILIATION_STATUS_CATEGORIES
         )
-        external_df.loc[external_matched_mask, RECONCILIATION_STATUS_COLUMN] = STATUS_RECONCILED
         external_df.loc[external_matched_mask, RECONCILIATION_NOTE_COLUMN] = SYSTEM_RECONCILED_NOTE
-        external_df.loc[~external_matched_mask, RECONCILIATION_STATUS_COLUMN] = STATUS_UNRECONCILED
-
-        self.external_debits = external_df
-        self.internal_payouts = internal_df
 
-        # Calculate summary
-        matched_count = len(external_df[external_df[RECONCILIATION_STATUS_COLUMN] == STATUS_RECONCILED])
-        unmatched_external = len(external_df[external_df[RECONCILIATION_STATUS_COLUMN] == STATUS_UNRECONCILED])
-        unmatched_internal = len(internal_df[internal_df[RECONCILIATION_STATUS_COLUMN] == STATUS_UNRECONCILED])
+        # Calculate summary from the match masks (every row is either reconciled or not)
+        matched_count = int(external_matched_mask.sum())
+        unmatched_external = len(external_df) - matched_count
+        unmatched_internal = len(internal_df) - int(internal_matched_mask.sum())
 
         logger.info(
             f"Reconciliation completed",
@@ -913,33 +955,82 @@ class Reconciler:
             RUN_ID_COLUMN,
             IS_MANUAL_COLUMN,
         ]
-        result = df[[col for col in columns if col in df.columns]].copy()
+        # Selecting a column list already builds a new frame; the shallow copy
+        # detaches it from df so the column writes below never touch the source
+        result = df[[col for col in columns if col in df.columns]].copy(deep=False)
+
+        # NaN/NaT -> None for MySQL compatibility. Only columns that hold missing
+        # values are converted to object; to_dict already yields native Python
+        # values for the rest, so they are not copied
+        has_missing = result.isna().any()
+        if has_missing.any():
+            missing_columns = has_missing.index[has_missing]
+            converted = result[missing_columns].astype(object)
+            result[missing_columns] = converted.where(converted.notna(), None)
 
-        # Convert pandas NaT to None for MySQL compatibility
-        if DATE_COLUMN in result.columns:
-            result[DATE_COLUMN] = result[DATE_COLUMN].where(
-                pd.notnull(result[DATE_COLUMN]), None
+        return result
+
+    def _find_existing_keys(self, prepared_df: pd.DataFrame) -> Set[Tuple[str, str]]:
+        """
+        Find (reconciliation_key, gateway) pairs from rows that are already stored.
+
+        Args:
+            prepared_df: Rows about to be inserted (see _prepare_dataframe_for_save).
+
+        Returns:
+            Set of (reconciliation_key, gateway) pairs already in the database.
+        """
+        # Distinct values straight from the columns, without materializing records
+        keys = []
+        if RECONCILIATION_KEY_COLUMN in prepared_df.columns:
+            keys = prepared_df[RECONCILIATION_KEY_COLUMN].dropna().unique().tolist()
+        gateways = prepared_df[GATEWAY_COLUMN].unique().tolist()
+        existing: Set[Tuple[str, str]] = set()
+        for start in range(0, len(keys), KEY_LOOKUP_BATCH_SIZE):
+            stmt = select(Transaction.reconciliation_key, Transaction.gateway).where(
+                and_(
+                    Transaction.gateway.in_(gateways),
+                    Transaction.reconciliation_key.in_(keys[start:start + KEY_LOOKUP_BATCH_SIZE]),
+                )
             )
+            existing.update(tuple(row) for row in self.db_session.execute(stmt).all())
+        return existing
 
-        # Handle NaN in numeric columns
-        for col in [DEBIT_COLUMN, CREDIT_COLUMN]:
-            if col in result.columns:
-                result[col] = result[col].where(pd.notnull(result[col]), None)
+    def _count_run_rows(self) -> int:
+        """Number of transactions stored under this run's run_id."""
+        return self.db_session.execute(
+            select(func.count()).select_from(Transaction).where(Transaction.run_id == self.run_id)
+        ).scalar_one()
 
-        # Handle NaN in string columns
-        string_cols = [
-            GATEWAY_TYPE_COLUMN,
-            RECONCILIATION_CATEGORY_COLUMN,
-            RECONCILIATION_NOTE_COLUMN,
-            RECONCILIATION_KEY_COLUMN,
-            SOURCE_FILE_COLUMN,
-            IS_MANUAL_COLUMN,
-        ]
-        for col in string_cols:
-            if col in result.columns:
-                result[col] = result[col].where(pd.notnull(result[col]), None)
+    def _insert_batch(self, records: List[dict]) -> Tuple[int, int]:
+        """
+        Insert a batch of records with a single multi-row INSERT ... ON DUPLICATE KEY UPDATE.
 
-        return result
+        Only rows that collide on a unique key (uq_recon_key_gateway, e.g. a
+        concurrent run, or a key that only differs in case from a stored one
+        under the column's case-insensitive collation) are left as stored; any
+        other row error (foreign key, NOT NULL, truncation) still raises.
+
+        The affected row count cannot tell a new row from a duplicate left as it
+        is, so the saved count is the change in the number of rows stored under
+        this run's run_id (every record carries it, and only this run writes it).
+
+        Args:
+            records: Transaction records to insert.
+
+        Returns:
+            Tuple of (records_saved, records_skipped).
+        """
+        stmt = mysql_insert(Transaction.__table__)
+        stmt = stmt.on_duplicate_key_update(id=stmt.table.c.id)
+
+        stored_before = self._count_run_rows()
+        self.db_session.execute(stmt, records)
+        saved = self._count_run_rows() - stored_before
+
+        if saved < len(records):
+            logger.debug(f"Skipped {len(records) - saved} duplicate(s) already stored")
+        return saved, len(records) - saved
 
     def _save_dataframe(self, df: pd.DataFrame, description: str) -> Tuple[int, int]:
         """
@@ -957,28 +1048,33 @@ class Reconciler:
 
         try:
             prepared_df = self._prepare_dataframe_for_save(df)
-            records = prepared_df.to_dict("records")
-            validated = [TransactionCreate(**rec) for rec in records]
-            payload = [v.model_dump(by_alias=False) for v in validated]
+            existing_keys = self._find_existing_keys(prepared_df)
 
             saved = 0
             skipped = 0
-            for record in payload:
-                try:
-                    # Use SAVEPOINT so a duplicate only rolls back this row, not the whole transaction
-                    nested = self.db_session.begin_nested()
-                    self.db_session.execute(
-                        Transaction.__table__.insert().values(**record)
-                    )
-                    nested.commit()
-                    saved += 1
-                except IntegrityError:
-                    nested.rollback()
-                    skipped += 1
-                    logger.debug(
-                        f"Skipped duplicate: {record.get('reconciliation_key')} "
-                        f"in {record.get('gateway')}"
-                    )
+            # Records are built and validated one batch at a time, so only a single
+            # batch of rows is alive at once
+            for start in range(0, len(prepared_df), SAVE_BATCH_SIZE):
+                records = prepared_df.iloc[start:start + SAVE_BATCH_SIZE].to_dict("records")
+                validated = TRANSACTION_CREATE_LIST_ADAPTER.validate_python(records)
+                payload = TRANSACTION_CREATE_LIST_ADAPTER.dump_python(validated, by_alias=False)
+
+                # Drop rows whose (reconciliation_key, gateway) already exists in the DB
+                # or earlier in this save, so the remaining rows can be inserted in bulk
+                new_records = []
+                for record in payload:
+                    pair = (record.get("reconciliation_key"), record.get("gateway"))
+                    if pair[0] is not None and pair in existing_keys:
+                        skipped += 1
+                        logger.debug(f"Skipped duplicate: {pair[0]} in {pair[1]}")
+                        continue
+                    existing_keys.add(pair)
+                    new_records.append(record)
+
+                if new_records:
+                    batch_saved, batch_skipped = self._insert_batch(new_records)
+                    saved += batch_saved
+                    skipped += batch_skipped
 
             if skipped > 0:
                 logger.info(
@@ -26,16 +26,16 @@ Excel Format Sheets:
 """
 import csv
 import logging
-from collections import Counter
 from datetime import date
-from io import BytesIO, StringIO
-from typing import Optional, List, Literal
+from io import BytesIO
+from typing import Optional, Literal
 
 import pandas as pd
 from sqlalchemy import select, and_, or_
 from sqlalchemy.orm import Session
 from starlette.responses import StreamingResponse
 
+from app.dataProcessing.GatewayFileClass import format_dates
 from app.reports.output_writer import write_to_excel
 from app.sqlModels.transactionEntities import Transaction, TransactionType, ReconciliationStatus
 
@@ -45,6 +45,36 @@ logger = logging.getLogger("app.reports")
 # Report format types
 ReportFormat = Literal["xlsx", "csv"]
 
+# Report columns, in sheet order
+REPORT_COLUMNS = [
+    "Date", "Transaction Reference", "Details", "Debit", "Credit",
+    "Reconciliation Status", "Reconciliation Note", "Reconciliation Key", "Run ID"
+]
+
+# Transaction columns read from the database to build a report
+REPORT_SOURCE_COLUMNS = [
+    Transaction.date,
+    Transaction.transaction_id,
+    Transaction.narrative,
+    Transaction.debit,
+    Transaction.credit,
+    Transaction.reconciliation_status,
+    Transaction.reconciliation_note,
+    Transaction.manual_recon_note,
+    Transaction.reconciliation_key,
+    Transaction.run_id,
+    Transaction.gateway,
+    Transaction.transaction_type,
+    Transaction.is_manually_reconciled,
+]
+
+# Low-cardinality columns only used to split rows into sheets; stored as
+# categoricals so comparisons and string checks run once per distinct value
+REPORT_CATEGORY_COLUMNS = ["gateway", "transaction_type", "is_manually_reconciled"]
+
+# Numeric(18, 2) columns arrive as Decimal objects; converted to float64 once on load
+REPORT_AMOUNT_COLUMNS = ["debit", "credit"]
+
 
 def load_transactions_for_gateway(
     db_session: Session,
@@ -52,10 +82,13 @@ def load_transactions_for_gateway(
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
     run_id: Optional[str] = None,
-) -> List[Transaction]:
+) -> pd.DataFrame:
     """
     Load all transactions for a base gateway (both external and internal).
 
+    Only the columns needed for the report are selected, and rows go straight
+    into a DataFrame without building ORM objects.
+
     Args:
         db_session: Database session.
         base_gateway: Base gateway name (e.g., 'equity', 'kcb', 'mpesa').
@@ -64,7 +97,9 @@ def load_transactions_for_gateway(
         run_id: Optional run ID filter.
 
     Returns:
-        List of Transaction records for both external and internal.
+        DataFrame of transactions (one column per REPORT_SOURCE_COLUMNS entry,
+        REPORT_CATEGORY_COLUMNS as categoricals, REPORT_AMOUNT_COLUMNS as float64)
+        for both external and internal.
     """
     base_lower = base_gateway.lower()
 
@@ -85,48 +120,46 @@ def load_transactions_for_gateway(
         conditions.append(Transaction.date <= date_to)
 
     stmt = (
-        select(Transaction)
+        select(*REPORT_SOURCE_COLUMNS)
         .where(and_(*conditions))
         .order_by(Transaction.date, Transaction.id)
     )
 
-    return db_session.execute(stmt).scalars().all()
+    rows = db_session.execute(stmt).all()
+    transactions = pd.DataFrame.from_records(
+        rows, columns=[column.key for column in REPORT_SOURCE_COLUMNS]
+    )
+    return transactions.astype({
+        **{col: "category" for col in REPORT_CATEGORY_COLUMNS},
+        **{col: "float64" for col in REPORT_AMOUNT_COLUMNS},
+    })
 
 
-def transactions_to_report_dataframe(transactions: List[Transaction]) -> pd.DataFrame:
+def transactions_to_report_dataframe(transactions: pd.DataFrame) -> pd.DataFrame:
     """
-    Convert transaction records to report DataFrame with required columns.
+    Convert transaction rows to report DataFrame with required columns.
 
     Columns: Date, Transaction Reference, Details, Debit, Credit,
              Reconciliation Status, Reconciliation Note, Reconciliation Key, Run ID
     """
-    if not transactions:
-        return pd.DataFrame(columns=[
-            "Date", "Transaction Reference", "Details", "Debit", "Credit",
-            "Reconciliation Status", "Reconciliation Note", "Reconciliation Key", "Run ID"
-        ])
-
-    records = []
-    for t in transactions:
-        recon_note = ""
-        if t.manual_recon_note:
-            recon_note = t.manual_recon_note
-        elif t.reconciliation_note:
-            recon_note = t.reconciliation_note
-
-        records.append({
-            "Date": t.date.strftime("%Y-%m-%d") if t.date else "",
-            "Transaction Reference": t.transaction_id or "",
-            "Details": t.narrative or "",
-            "Debit": float(t.debit) if t.debit else 0.0,
-            "Credit": float(t.credit) if t.credit else 0.0,
-            "Reconciliation Status": t.reconciliation_status or "",
-            "Reconciliation Note": recon_note,
-            "Reconciliation Key": t.reconciliation_key or "",
-            "Run ID": t.run_id or "",
-        })
-
-    return pd.DataFrame(records)
+    if transactions.empty:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+
+    # Manual note takes precedence over the system note
+    manual_note = transactions["manual_recon_note"].fillna("")
+    recon_note = manual_note.where(manual_note != "", transactions["reconciliation_note"].fillna(""))
+
+    return pd.DataFrame({
+        "Date": format_dates(pd.to_datetime(transactions["date"]), "%Y-%m-%d"),
+        "Transaction Reference": transactions["transaction_id"].fillna(""),
+        "Details": transactions["narrative"].fillna(""),
+        "Debit": transactions["debit"].fillna(0),
+        "Credit": transactions["credit"].fillna(0),
+        "Reconciliation Status": transactions["reconciliation_status"].fillna(""),
+        "Reconciliation Note": recon_note,
+        "Reconciliation Key": transactions["reconciliation_key"].fillna(""),
+        "Run ID": transactions["run_id"].fillna(""),
+    }).reset_index(drop=True)
 
 
 def download_gateway_report_filtered(
@@ -155,7 +188,6 @@ def download_gateway_report_filtered(
         ValueError: If no transactions found.
     """
     gateway_lower = gateway.lower()
-    gateway_display = gateway.capitalize()
 
     # Load transactions with filters
     transactions = load_transactions_for_gateway(
@@ -165,7 +197,7 @@ def download_gateway_report_filtered(
         run_id=run_id,
     )
 
-    if not transactions:
+    if transactions.empty:
         filter_desc = f"gateway '{gateway}'"
         if date_from:
             filter_desc += f" from {date_from}"
@@ -176,11 +208,11 @@ def download_gateway_report_filtered(
         raise ValueError(f"No transactions found for {filter_desc}")
 
     # Log loaded transactions breakdown for diagnostics
-    gw_counts = Counter(t.gateway for t in transactions)
-    type_counts = Counter(t.transaction_type for t in transactions)
+    gw_counts = transactions["gateway"].value_counts(sort=False).to_dict()
+    type_counts = transactions["transaction_type"].value_counts(sort=False).to_dict()
     logger.info(
         f"Report for '{gateway}': loaded {len(transactions)} transactions. "
-        f"By gateway: {dict(gw_counts)}. By type: {dict(type_counts)}"
+        f"By gateway: {gw_counts}. By type: {type_counts}"
     )
 
     # Generate filename
@@ -197,14 +229,14 @@ def download_gateway_report_filtered(
         # Single flat CSV file
         df = transactions_to_report_dataframe(transactions)
 
-        output = StringIO()
-        df.to_csv(output, index=False, quoting=csv.QUOTE_NONNUMERIC)
+        # Encode straight into the response buffer instead of building the text
+        # in a StringIO and copying it into bytes afterwards
+        output = BytesIO()
+        df.to_csv(output, index=False, quoting=csv.QUOTE_NONNUMERIC, encoding="utf-8")
         output.seek(0)
 
-        csv_bytes = BytesIO(output.getvalue().encode('utf-8'))
-
         return StreamingResponse(
-            csv_bytes,
+            output,
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename={base_filename}.csv"
@@ -212,46 +244,28 @@ def download_gateway_report_filtered(
         )
     else:
         # Multi-sheet Excel report: 8 sheets split by side, reconciliation status, and manual
-        unreconciled_external = []
-        unreconciled_internal = []
-        reconciled_external = []
-        reconciled_internal = []
-        manual_external = []
-        manual_internal = []
-        charges = []
-        deposits = []
-
-        for txn in transactions:
-            gateway_name = txn.gateway or ""
-            txn_type = txn.transaction_type or ""
-            recon_status = txn.reconciliation_status or ""
-            is_manual = txn.is_manually_reconciled == "true"
-
-            is_internal = (
-                gateway_name.endswith("_internal") or
-                gateway_name.startswith("workpay_")
-            )
-            is_reconciled = recon_status == ReconciliationStatus.RECONCILED.value
-
-            if txn_type == TransactionType.CHARGE.value:
-                charges.append(txn)
-            elif txn_type == TransactionType.DEPOSIT.value:
-                deposits.append(txn)
-            elif is_manual:
-                if is_internal:
-                    manual_internal.append(txn)
-                else:
-                    manual_external.append(txn)
-            elif is_internal:
-                if is_reconciled:
-                    reconciled_internal.append(txn)
-                else:
-                    unreconciled_internal.append(txn)
-            else:
-                if is_reconciled:
-                    reconciled_external.append(txn)
-                else:
-                    unreconciled_external.append(txn)
+        # gateway and transaction_type are NOT NULL categoricals (see REPORT_CATEGORY_COLUMNS)
+        gateway_names = transactions["gateway"]
+        txn_type = transactions["transaction_type"]
+
+        is_charge = txn_type == TransactionType.CHARGE.value
+        is_deposit = ~is_charge & (txn_type == TransactionType.DEPOSIT.value)
+        is_manual = ~is_charge & ~is_deposit & (transactions["is_manually_reconciled"] == "true")
+        is_automatic = ~is_charge & ~is_deposit & ~is_manual
+        is_internal = (
+            gateway_names.str.endswith("_internal") |
+            gateway_names.str.startswith("workpay_")
+        )
+        is_reconciled = transactions["reconciliation_status"] == ReconciliationStatus.RECONCILED.value
+
+        unreconciled_external = transactions[is_automatic & ~is_internal & ~is_reconciled]
+        unreconciled_internal = transactions[is_automatic & is_internal & ~is_reconciled]
+        reconciled_external = transactions[is_automatic & ~is_internal & is_reconciled]
+        reconciled_internal = transactions[is_automatic & is_internal & is_reconciled]
+        manual_external = transactions[is_manual & ~is_internal]
+        manual_internal = transactions[is_manual & is_internal]
+        charges = transactions[is_charge]
+        deposits = transactions[is_deposit]
 
         logger.info(
             f"Report sheet breakdown: "
@@ -1,54 +1,57 @@
-from openpyxl.styles import Border, Side, Font, PatternFill, Alignment
 import pandas as pd
+from xlsxwriter import Workbook
+
+# Widest a column is allowed to grow to (in characters)
+MAX_COLUMN_WIDTH = 50
+
+
+def _column_widths(df: pd.DataFrame) -> list:
+    """Width per column: longest header/cell text plus padding, capped at MAX_COLUMN_WIDTH."""
+    widths = []
+    for col in df.columns:
+        max_length = len(str(col))
+        if not df.empty:
+            max_length = max(max_length, int(df[col].astype(str).str.len().max()))
+        widths.append(min(max_length + 2, MAX_COLUMN_WIDTH))
+    return widths
 
 
 def write_to_excel(output, data):
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+    # constant_memory flushes each row to the zip stream as soon as the next row starts,
+    # so rows MUST be written top to bottom (header first, then data in order).
+    workbook = Workbook(output, {
+        'constant_memory': True,
+        'use_zip64': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'nan_inf_to_errors': True,
+    })
+    try:
+        # Regular cells: Garamond with a thin border
+        body_format = workbook.add_format({
+            'font_name': 'Garamond',
+            'font_size': 11,
+            'border': 1,
+        })
+        # Header row: bold, grey fill, centered
+        header_format = workbook.add_format({
+            'font_name': 'Garamond',
+            'font_size': 12,
+            'bold': True,
+            'bg_color': '#D3D3D3',
+            'pattern': 1,
+            'border': 1,
+            'align': 'center',
+            'valign': 'vcenter',
+        })
         for sheet_name, df in data.items():
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-        # Access the workbook
-        workbook = writer.book
-        # Define styles
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        # Regular font
-        garamond_font = Font(name='Garamond', size=11)
-        # Header font (bold)
-        header_font = Font(name='Garamond', size=12, bold=True)
-        # Header background color (optional)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-        # Center alignment
-        center_alignment = Alignment(horizontal='center', vertical='center')
-        # Apply formatting to each sheet
-        for sheet_name in data.keys():
-            worksheet = workbook[sheet_name]
-            max_row = worksheet.max_row
-            max_col = worksheet.max_column
-            # Format all cells
-            for row in range(1, max_row + 1):
-                for col in range(1, max_col + 1):
-                    cell = worksheet.cell(row=row, column=col)
-                    cell.border = thin_border
-                    # Header row formatting
-                    if row == 1:
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = center_alignment
-                    else:
-                        cell.font = garamond_font
-            # Auto-adjust column widths (optional)
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                worksheet.column_dimensions[column_letter].width = adjusted_width
\ No newline at end of file
+            worksheet = workbook.add_worksheet(sheet_name)
+            # Auto-adjust column widths before any rows are flushed
+            for col_idx, width in enumerate(_column_widths(df)):
+                worksheet.set_column(col_idx, col_idx, width)
+
+            worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+            for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row_idx, 0, row, body_format)
+    finally:
+        workbook.close()
@@ -11,8 +11,14 @@ XLS_EXTENSION = ".xls"
 CSV_EXTENSION = ".csv"
 SUPPORTED_EXTENSIONS = (XLSX_EXTENSION, XLS_EXTENSION, CSV_EXTENSION)
 
-# Pandas engines for Excel files
-XLSX_ENGINE = "openpyxl"
+# Pandas engines for Excel files. calamine parses natively and is much faster than
+# openpyxl, but needs python-calamine; without it .xlsx files are read with openpyxl.
+# xlrd stays as the fallback for legacy .xls files the first engine cannot open.
+try:
+    import python_calamine  # noqa: F401
+    XLSX_ENGINE = "calamine"
+except ImportError:
+    XLSX_ENGINE = "openpyxl"
 XLS_ENGINE = "xlrd"
 
 
@@ -1,12 +1,10 @@
-import os
-import tempfile
 from typing import List, BinaryIO
 from urllib.parse import unquote
 
 import gcsfs
 
 from app.exceptions.exceptions import FileUploadException, ReadFileException
-from app.storage.base import StorageBackend, XLS_EXTENSION
+from app.storage.base import StorageBackend
 
 
 class GcsStorage(StorageBackend):
@@ -86,34 +84,6 @@ class GcsStorage(StorageBackend):
         except Exception as e:
             raise ReadFileException(f"Failed to open file from GCS {filename}: {str(e)}")
 
-    def get_file_handle_for_xls(self, gateway: str, filename: str) -> str:
-        """
-        Get a local temp file path for XLS files.
-        xlrd requires a real file on disk, not a stream.
-        """
-        try:
-            content = self.read_file_bytes(gateway, filename)
-            if not content:
-                raise ReadFileException(f"File is empty: {filename}")
-
-            with tempfile.NamedTemporaryFile(suffix=XLS_EXTENSION, delete=False) as tmp_file:
-                tmp_file.write(content)
-                tmp_file.flush()
-                return tmp_file.name
-        except ReadFileException:
-            raise
-        except Exception as e:
-            raise ReadFileException(f"Failed to create temp file for XLS {filename}: {str(e)}")
-
-    @staticmethod
-    def cleanup_temp_file(temp_path: str) -> None:
-        """Clean up a temporary file created for XLS reading."""
-        try:
-            if temp_path and os.path.exists(temp_path):
-                os.remove(temp_path)
-        except OSError:
-            pass
-
     def archive_file(self, gateway: str, filename: str, content: bytes) -> str:
         """Save a file to the archive subdirectory in GCS."""
         try: